@@ -1,22 +1,43 @@
 """AI module package for model integrations, prompt builders, and AI model factory."""
 
+from functools import lru_cache
+from typing import Dict, Type
+
 from src.ai.base_model import BaseAIModel
+from src.ai.caching_model import CachingAIModel, InMemoryCache, SqliteCache
 from src.ai.claude_model import ClaudeModel
 from src.ai.mock_model import MockAIModel
 from src.ai.openai_model import OpenAIModel
-from src.config import settings
+from src.config import get_settings
+
 
+_REGISTRY: Dict[str, Type[BaseAIModel]] = {
+    "mock": MockAIModel,
+    "claude": ClaudeModel,
+    "openai": OpenAIModel,
+}
 
+
+@lru_cache(maxsize=1)
 def get_ai_model() -> BaseAIModel:
-    """Factory function that returns the configured AI model."""
+    """Factory function that returns the configured AI model (created once)."""
+
+    settings = get_settings()
+    try:
+        model_cls = _REGISTRY[settings.ai_model]
+    except KeyError:
+        raise ValueError(f"Unknown AI model: {settings.ai_model}") from None
 
-    if settings.ai_model == "mock":
-        return MockAIModel()
-    if settings.ai_model == "claude":
-        return ClaudeModel()
-    if settings.ai_model == "openai":
-        return OpenAIModel()
-    raise ValueError(f"Unknown AI model: {settings.ai_model}")
+    model = model_cls()
+    if settings.response_cache_ttl > 0:
+        # Each run is a fresh process, so responses are kept on disk unless
+        # no cache path is configured.
+        if settings.response_cache_file is not None:
+            cache = SqliteCache(settings.response_cache_file)
+        else:
+            cache = InMemoryCache()
+        return CachingAIModel(model, ttl=settings.response_cache_ttl, cache=cache)
+    return model
 
 
-__all__ = ["get_ai_model", "BaseAIModel"]
+__all__ = ["get_ai_model", "BaseAIModel", "CachingAIModel"]
@@ -0,0 +1,39 @@
+"""Prompt text shared by the hosted AI model implementations."""
+
+import textwrap
+
+
+USER_INSTRUCTION: str = textwrap.dedent(
+    """\
+    Based on the market data and your current portfolio,
+    make a trading decision for EACH coin. Respond ONLY with a valid JSON array
+    containing one object per coin in this exact format:
+
+    [
+        {
+            "symbol": "BTC-PERPETUAL",
+            "action": "BUY",
+            "confidence": 0.88,
+            "reasoning": "Your analysis here",
+            "entry_type": "MARKET",
+            "entry_price": null,
+            "stop_loss": 105877.7,
+            "take_profit": 112253.96,
+            "position_size_pct": 20
+        }
+    ]
+
+    Rules:
+    - include exactly one decision per coin
+    - keep reasoning brief (one or two sentences)
+    - action must be: BUY, SELL, or HOLD
+    - confidence: 0.0 to 1.0
+    - entry_type: MARKET or LIMIT
+    - If MARKET, entry_price should be null
+    - stop_loss and take_profit should be reasonable prices
+    - position_size_pct: percentage of account to use (1-100)
+    """
+)
+
+# Anthropic content-block form of the same text.
+USER_MESSAGE_BLOCKS = ({"type": "text", "text": USER_INSTRUCTION},)
@@ -0,0 +1,150 @@
+"""Response cache wrapper for AI trading models."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from src.ai.base_model import BaseAIModel
+from src.ai.prompt_builder import PromptBuilder
+from src.logger import log
+
+
+class InMemoryCache:
+    """Small LRU mapping of cache keys to ``(value, stored_at)`` pairs."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = max(maxsize, 1)
+        self._entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: str, stored_at: float) -> None:
+        self._entries[key] = (value, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SqliteCache:
+    """``InMemoryCache`` backed by a sqlite table so entries survive restarts.
+
+    The bot runs one iteration per process; a response cached in memory
+    would never be read again, so the default store lives on disk.
+    """
+
+    def __init__(self, path: Path, maxsize: int = 256) -> None:
+        self.maxsize = max(maxsize, 1)
+        self._db: Optional[sqlite3.Connection] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL)"
+            )
+            db.commit()
+            self._db = db
+        except sqlite3.Error as exc:
+            log.warning("AI response cache disabled ({}): {}", path, exc)
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        if self._db is None:
+            return None
+        try:
+            return self._db.execute(
+                "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as exc:
+            log.warning("AI response cache read failed: {}", exc)
+            return None
+
+    def set(self, key: str, value: str, stored_at: float) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, value, stored_at),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key NOT IN"
+                " (SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                (self.maxsize,),
+            )
+            self._db.commit()
+        except sqlite3.Error as exc:
+            log.warning("AI response cache write failed: {}", exc)
+
+    def pop(self, key: str) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+        except sqlite3.Error as exc:
+            log.warning("AI response cache write failed: {}", exc)
+
+    def clear(self) -> None:
+        if self._db is None:
+            return
+        self._db.execute("DELETE FROM responses")
+        self._db.commit()
+
+
+class CachingAIModel(BaseAIModel):
+    """Return previous responses for repeated prompts instead of calling the API."""
+
+    def __init__(
+        self,
+        inner: BaseAIModel,
+        ttl: float,
+        cache: Optional[Union[InMemoryCache, SqliteCache]] = None,
+    ) -> None:
+        self.inner = inner
+        self.ttl = ttl
+        self.cache = cache or InMemoryCache()
+        self._model_name = getattr(inner, "model", type(inner).__name__)
+
+    def _cache_key(self, system_prompt: str) -> str:
+        # The invocation counter and timestamp differ on every call even when
+        # the market data does not, so they are excluded from the key.
+        prompt = PromptBuilder.strip_volatile_header(system_prompt)
+        return hashlib.sha256(f"{self._model_name}|{prompt}".encode()).hexdigest()
+
+    async def get_trading_decision(self, system_prompt: str) -> str:
+        """Return a cached decision when fresh, otherwise delegate to the model."""
+
+        key = self._cache_key(system_prompt)
+        entry = self.cache.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            # Wall-clock time, since a disk-backed entry outlives the process.
+            if time.time() - stored_at < self.ttl:
+                log.info("AI response served from cache")
+                return value
+            self.cache.pop(key)
+
+        value = await self.inner.get_trading_decision(system_prompt)
+        if value:
+            self.cache.set(key, value, time.time())
+        return value
+
+
+__all__ = ["CachingAIModel", "InMemoryCache", "SqliteCache"]
@@ -1,75 +1,80 @@
 """Claude (Anthropic) AI model implementation."""
 
-import asyncio
-import textwrap
+from functools import lru_cache
+from typing import Any, Dict
 
 import anthropic
 
+from src.ai._prompts import USER_MESSAGE_BLOCKS
 from src.ai.base_model import BaseAIModel
-from src.config import settings
+from src.ai.response_parser import JsonStreamScanner
+from src.config import get_settings
 from src.logger import log
 
 
-_USER_MESSAGE = textwrap.dedent(
-    """\
-    Based on the market data and your current portfolio,
-    make a trading decision for ONE coin. Respond ONLY with valid JSON in this exact format:
-
-    {
-        "symbol": "BTC-PERPETUAL",
-        "action": "BUY",
-        "confidence": 0.88,
-        "reasoning": "Your analysis here",
-        "entry_type": "MARKET",
-        "entry_price": null,
-        "stop_loss": 105877.7,
-        "take_profit": 112253.96,
-        "position_size_pct": 20
-    }
-
-    Rules:
-    - action must be: BUY, SELL, or HOLD
-    - confidence: 0.0 to 1.0
-    - entry_type: MARKET or LIMIT
-    - If MARKET, entry_price should be null
-    - stop_loss and take_profit should be reasonable prices
-    - position_size_pct: percentage of account to use (1-100)
-    """
-)
+_STATIC_USER_MESSAGES = ({"role": "user", "content": list(USER_MESSAGE_BLOCKS)},)
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return a shared Anthropic client so its HTTP connection pool is reused."""
+
+    return anthropic.AsyncAnthropic(api_key=api_key)
 
 
 class ClaudeModel(BaseAIModel):
     """Claude (Anthropic) AI model implementation."""
 
     def __init__(self) -> None:
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        self.client = _get_client(get_settings().anthropic_api_key)
         self.model = "claude-sonnet-4-20250514"
         log.info("Claude AI model initialized")
 
     async def get_trading_decision(self, system_prompt: str) -> str:
         """Get a trading decision from Claude."""
 
+        request: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": 2048,
+            "system": system_prompt,
+            "messages": list(_STATIC_USER_MESSAGES),
+        }
+
         try:
-            message = await asyncio.to_thread(
-                self.client.messages.create,
-                model=self.model,
-                max_tokens=1024,
-                system=system_prompt,
-                messages=[{"role": "user", "content": _USER_MESSAGE}],
-            )
-
-            response_text = ""
-            if getattr(message, "content", None):
-                first_message = message.content[0]
-                response_text = getattr(first_message, "text", "")
+            try:
+                response_text = await self._stream_decision(request)
+            except anthropic.APIConnectionError as exc:
+                log.warning("Claude stream failed ({}), retrying without streaming", exc)
+                response_text = await self._create_decision(request)
 
             if not response_text:
                 log.warning("Claude response was empty")
 
             log.info("Claude response received: {} chars", len(response_text))
-            log.debug("Raw Claude response: {}", response_text)
+            log.opt(lazy=True).debug("Raw Claude response: {}", lambda: response_text)
 
             return response_text
         except Exception as exc:  # pragma: no cover - depends on external API
             log.exception("Error calling Claude API: {}", exc)
             raise
+
+    async def _stream_decision(self, request: Dict[str, Any]) -> str:
+        """Stream the response and stop reading once the decision JSON closes."""
+
+        scanner = JsonStreamScanner()
+        async with self.client.messages.stream(**request) as stream:
+            async for text in stream.text_stream:
+                if scanner.feed(text):
+                    break
+        return scanner.text
+
+    async def _create_decision(self, request: Dict[str, Any]) -> str:
+        """Request the full response without streaming."""
+
+        message = await self.client.messages.create(**request)
+
+        response_text = ""
+        if getattr(message, "content", None):
+            first_message = message.content[0]
+            response_text = getattr(first_message, "text", "")
+        return response_text
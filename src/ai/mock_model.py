@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import orjson
 
 from src.ai.base_model import BaseAIModel
-from src.config import settings
+from src.config import get_settings
 
 
 @dataclass
@@ -23,23 +25,27 @@ class MockDecision:
     entry_price: float | None = None
     stop_loss: float | None = None
     take_profit: float | None = None
-    position_size_pct: float = settings.position_size_pct
+    position_size_pct: float = field(default_factory=lambda: get_settings().position_size_pct)
 
     def to_json(self) -> str:
         """Return a JSON encoded representation of the decision."""
 
-        return json.dumps(self.__dict__)
+        return orjson.dumps(self).decode()
 
 
 class MockAIModel(BaseAIModel):
     """Mock AI model that keeps the trading loop operational."""
 
+    @cached_property
+    def _payload(self) -> str:
+        # The decisions never vary between ticks, so encode them once.
+        symbols = get_settings().symbol_list or ("BTC-PERPETUAL",)
+        return orjson.dumps([MockDecision(symbol=symbol) for symbol in symbols]).decode()
+
     async def get_trading_decision(self, system_prompt: str) -> str:
-        """Return a HOLD decision encoded as JSON."""
+        """Return a HOLD decision for every configured symbol encoded as JSON."""
 
-        first_symbol = settings.symbol_list[0] if settings.symbol_list else "BTC-PERPETUAL"
-        decision = MockDecision(symbol=first_symbol)
-        return decision.to_json()
+        return self._payload
 
 
 __all__ = ["MockAIModel"]
@@ -1,80 +1,91 @@
 """OpenAI (GPT) AI model implementation."""
 
-import asyncio
-import textwrap
+from functools import lru_cache
+from typing import Any, Dict
 
 import openai
 
+from src.ai._prompts import USER_INSTRUCTION
 from src.ai.base_model import BaseAIModel
-from src.config import settings
+from src.ai.response_parser import JsonStreamScanner
+from src.config import get_settings
 from src.logger import log
 
 
-_USER_MESSAGE = textwrap.dedent(
-    """\
-    Based on the market data and your current portfolio,
-    make a trading decision for ONE coin. Respond ONLY with valid JSON in this exact format:
-
-    {
-        "symbol": "BTC-PERPETUAL",
-        "action": "BUY",
-        "confidence": 0.88,
-        "reasoning": "Your analysis here",
-        "entry_type": "MARKET",
-        "entry_price": null,
-        "stop_loss": 105877.7,
-        "take_profit": 112253.96,
-        "position_size_pct": 20
-    }
-
-    Rules:
-    - action must be: BUY, SELL, or HOLD
-    - confidence: 0.0 to 1.0
-    - entry_type: MARKET or LIMIT
-    - If MARKET, entry_price should be null
-    - stop_loss and take_profit should be reasonable prices
-    - position_size_pct: percentage of account to use (1-100)
-    """
-)
+_STATIC_USER_TURN = {"role": "user", "content": USER_INSTRUCTION}
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> openai.AsyncOpenAI:
+    """Return a shared OpenAI client so its HTTP connection pool is reused."""
+
+    return openai.AsyncOpenAI(api_key=api_key)
 
 
 class OpenAIModel(BaseAIModel):
     """OpenAI (GPT) AI model implementation."""
 
     def __init__(self) -> None:
-        self.client = openai.OpenAI(api_key=settings.openai_api_key)
+        self.client = _get_client(get_settings().openai_api_key)
         self.model = "gpt-4-turbo-preview"
         log.info("OpenAI AI model initialized")
 
     async def get_trading_decision(self, system_prompt: str) -> str:
         """Get a trading decision from OpenAI."""
 
+        request: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                _STATIC_USER_TURN,
+            ],
+            "temperature": 0.7,
+            "max_tokens": 2048,
+        }
+
         try:
-            completion = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": _USER_MESSAGE},
-                ],
-                temperature=0.7,
-                max_tokens=1024,
-            )
-
-            response_text = ""
-            if getattr(completion, "choices", None):
-                first_choice = completion.choices[0]
-                message = getattr(first_choice, "message", None)
-                if message is not None:
-                    response_text = getattr(message, "content", "") or ""
+            try:
+                response_text = await self._stream_decision(request)
+            except openai.APIConnectionError as exc:
+                log.warning("OpenAI stream failed ({}), retrying without streaming", exc)
+                response_text = await self._create_decision(request)
 
             if not response_text:
                 log.warning("OpenAI response was empty")
 
             log.info("OpenAI response received: {} chars", len(response_text))
-            log.debug("Raw OpenAI response: {}", response_text)
+            log.opt(lazy=True).debug("Raw OpenAI response: {}", lambda: response_text)
 
             return response_text
         except Exception as exc:  # pragma: no cover - depends on external API
             log.exception("Error calling OpenAI API: {}", exc)
             raise
+
+    async def _stream_decision(self, request: Dict[str, Any]) -> str:
+        """Stream the response and stop reading once the decision JSON closes."""
+
+        scanner = JsonStreamScanner()
+        stream = await self.client.chat.completions.create(**request, stream=True)
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta and scanner.feed(delta):
+                    break
+        finally:
+            await stream.close()
+        return scanner.text
+
+    async def _create_decision(self, request: Dict[str, Any]) -> str:
+        """Request the full response without streaming."""
+
+        completion = await self.client.chat.completions.create(**request)
+
+        response_text = ""
+        if getattr(completion, "choices", None):
+            first_choice = completion.choices[0]
+            message = getattr(first_choice, "message", None)
+            if message is not None:
+                response_text = getattr(message, "content", "") or ""
+        return response_text
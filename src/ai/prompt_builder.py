@@ -2,14 +2,82 @@
 
 from __future__ import annotations
 
-import json
+import re
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Dict, Iterable, List
 
-from src.config import settings
+import numpy as np
+import orjson
+
+from src.config import get_settings
 from src.exchanges.base import Position
 
 
+# Identical on every invocation, so it leads the prompt ahead of the per-call header.
+STATIC_HEADER = (
+    "Below, we are providing you with a variety of state data, price data, and predictive signals.\n\n"
+    "ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED: OLDEST → NEWEST"
+)
+
+MARKET_STATE_TITLE = "CURRENT MARKET STATE FOR ALL COINS"
+
+_render_time_preamble = (
+    "It has been {} invocations since you started trading.\n"
+    "The current time is {}."
+).format
+
+# Indicator series arrive as NumPy-backed values; serialise them natively.
+# orjson output is compact ("[1.5,2.0]") and writes NaN/inf as null, unlike
+# json.dumps; tests/test_prompt_builder.py pins this format.
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+_POSITION_KEYS = (
+    "symbol",
+    "side",
+    "quantity",
+    "entry_price",
+    "current_price",
+    "liquidation_price",
+    "unrealized_pnl",
+    "leverage",
+)
+_position_fields = attrgetter(*_POSITION_KEYS)
+
+_render_coin_section = (
+    "ALL {coin} DATA\n"
+    "current_price = {current_price}, "
+    "current_ema20 = {current_ema20}, "
+    "current_macd = {current_macd}, "
+    "current_rsi (7 period) = {current_rsi_7}\n\n"
+    "Open Interest: Latest: {open_interest} "
+    "Average: {open_interest_avg}\n"
+    "Funding Rate: {funding_rate}\n\n"
+    "Intraday series (3-minute intervals, oldest → latest):\n"
+    "Mid prices: {prices}\n"
+    "EMA indicators (20-period): {ema_20_series}\n"
+    "MACD indicators: {macd_series}\n"
+    "RSI indicators (7-Period): {rsi_7_series}\n"
+    "RSI indicators (14-Period): {rsi_14_series}\n\n"
+    "Longer-term context (4-hour timeframe):\n"
+    "20-Period EMA: {ema_20_4h} vs. "
+    "50-Period EMA: {ema_50_4h}\n"
+    "3-Period ATR: {atr_3_4h} vs. "
+    "14-Period ATR: {atr_14_4h}\n"
+    "Current Volume: {volume_4h} vs. "
+    "Average Volume: {avg_volume_4h}\n"
+    "MACD indicators: {macd_series_4h}\n"
+    "RSI indicators (14-Period): {rsi_14_series_4h}"
+).format_map
+
+# Matches the invocation counter/timestamp lines emitted by ``_build_time_preamble``.
+_VOLATILE_HEADER_RE = re.compile(
+    r"^It has been \d+ invocations since you started trading\.\n"
+    r"The current time is [^\n]*\.\n",
+    re.MULTILINE,
+)
+
+
 class PromptBuilder:
     """Builds AI system prompts from market data."""
 
@@ -24,59 +92,53 @@ class PromptBuilder:
     ) -> str:
         """Build the complete system prompt for the AI model."""
 
-        prompt_parts: List[str] = []
-        prompt_parts.append(self._build_header())
-
-        for symbol in settings.symbol_list:
-            coin_data = market_data.get(symbol, {})
-            prompt_parts.append(self._build_coin_section(symbol, coin_data))
-
-        prompt_parts.append(self._build_portfolio_section(portfolio_state, positions))
+        coin_section = self._build_coin_section
+        prompt_parts: List[str] = [
+            STATIC_HEADER,
+            self._build_time_preamble(),
+            MARKET_STATE_TITLE,
+            *[coin_section(symbol, market_data.get(symbol, {})) for symbol in get_settings().symbol_list],
+            self._build_portfolio_section(portfolio_state, positions),
+        ]
         return "\n\n".join(prompt_parts)
 
-    def _build_header(self) -> str:
-        """Construct the header section of the prompt."""
+    def _build_time_preamble(self) -> str:
+        """Construct the per-invocation lines that follow the static prefix."""
 
-        current_time = datetime.now().isoformat()
-        return (
-            f"It has been {self.invocation_count} invocations since you started trading.\n"
-            f"The current time is {current_time}.\n\n"
-            "Below, we are providing you with a variety of state data, price data, and predictive signals.\n\n"
-            "ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED: OLDEST → NEWEST\n\n"
-            "CURRENT MARKET STATE FOR ALL COINS"
-        )
+        return _render_time_preamble(self.invocation_count, datetime.now().isoformat())
 
     def _build_coin_section(self, symbol: str, data: Dict[str, Any]) -> str:
         """Construct the market data section for a single coin."""
 
-        coin = symbol.replace("-PERPETUAL", "")
         intraday: Dict[str, Any] = data.get("intraday", {}) or {}
         longer_term: Dict[str, Any] = data.get("longer_term", {}) or {}
+        value = self._format_value
+        series = self._format_series
 
-        return (
-            f"ALL {coin} DATA\n"
-            f"current_price = {self._format_value(intraday.get('current_price'))}, "
-            f"current_ema20 = {self._format_value(intraday.get('current_ema20'))}, "
-            f"current_macd = {self._format_value(intraday.get('current_macd'))}, "
-            f"current_rsi (7 period) = {self._format_value(intraday.get('current_rsi_7'))}\n\n"
-            f"Open Interest: Latest: {self._format_value(data.get('open_interest'))} "
-            f"Average: {self._format_value(data.get('open_interest_avg'))}\n"
-            f"Funding Rate: {self._format_value(data.get('funding_rate'))}\n\n"
-            "Intraday series (3-minute intervals, oldest → latest):\n"
-            f"Mid prices: {self._format_series(intraday.get('prices'))}\n"
-            f"EMA indicators (20-period): {self._format_series(intraday.get('ema_20'))}\n"
-            f"MACD indicators: {self._format_series(intraday.get('macd'))}\n"
-            f"RSI indicators (7-Period): {self._format_series(intraday.get('rsi_7'))}\n"
-            f"RSI indicators (14-Period): {self._format_series(intraday.get('rsi_14'))}\n\n"
-            "Longer-term context (4-hour timeframe):\n"
-            f"20-Period EMA: {self._format_value(longer_term.get('ema_20'))} vs. "
-            f"50-Period EMA: {self._format_value(longer_term.get('ema_50'))}\n"
-            f"3-Period ATR: {self._format_value(longer_term.get('atr_3'))} vs. "
-            f"14-Period ATR: {self._format_value(longer_term.get('atr_14'))}\n"
-            f"Current Volume: {self._format_value(longer_term.get('current_volume'))} vs. "
-            f"Average Volume: {self._format_value(longer_term.get('avg_volume'))}\n"
-            f"MACD indicators: {self._format_series(longer_term.get('macd'))}\n"
-            f"RSI indicators (14-Period): {self._format_series(longer_term.get('rsi_14'))}"
+        return _render_coin_section(
+            {
+                "coin": symbol.replace("-PERPETUAL", ""),
+                "current_price": value(intraday.get("current_price")),
+                "current_ema20": value(intraday.get("current_ema20")),
+                "current_macd": value(intraday.get("current_macd")),
+                "current_rsi_7": value(intraday.get("current_rsi_7")),
+                "open_interest": value(data.get("open_interest")),
+                "open_interest_avg": value(data.get("open_interest_avg")),
+                "funding_rate": value(data.get("funding_rate")),
+                "prices": series(intraday.get("prices")),
+                "ema_20_series": series(intraday.get("ema_20")),
+                "macd_series": series(intraday.get("macd")),
+                "rsi_7_series": series(intraday.get("rsi_7")),
+                "rsi_14_series": series(intraday.get("rsi_14")),
+                "ema_20_4h": value(longer_term.get("ema_20")),
+                "ema_50_4h": value(longer_term.get("ema_50")),
+                "atr_3_4h": value(longer_term.get("atr_3")),
+                "atr_14_4h": value(longer_term.get("atr_14")),
+                "volume_4h": value(longer_term.get("current_volume")),
+                "avg_volume_4h": value(longer_term.get("avg_volume")),
+                "macd_series_4h": series(longer_term.get("macd")),
+                "rsi_14_series_4h": series(longer_term.get("rsi_14")),
+            }
         )
 
     def _build_portfolio_section(
@@ -87,20 +149,13 @@ class PromptBuilder:
         """Construct the portfolio performance section."""
 
         positions_formatted = [
-            {
-                "symbol": position.symbol,
-                "side": position.side,
-                "quantity": position.quantity,
-                "entry_price": position.entry_price,
-                "current_price": position.current_price,
-                "liquidation_price": position.liquidation_price,
-                "unrealized_pnl": position.unrealized_pnl,
-                "leverage": position.leverage,
-            }
-            for position in positions
+            dict(zip(_POSITION_KEYS, _position_fields(position))) for position in positions
         ]
 
-        positions_json = json.dumps(positions_formatted, indent=2)
+        positions_json = orjson.dumps(
+            positions_formatted,
+            option=_JSON_OPTIONS | orjson.OPT_INDENT_2,
+        ).decode()
 
         return (
             "HERE IS YOUR ACCOUNT INFORMATION & PERFORMANCE\n"
@@ -111,6 +166,12 @@ class PromptBuilder:
             f"Sharpe Ratio: {self._format_value(portfolio.get('sharpe_ratio'))}"
         )
 
+    @staticmethod
+    def strip_volatile_header(prompt: str) -> str:
+        """Return the prompt without the lines that change on every invocation."""
+
+        return _VOLATILE_HEADER_RE.sub("", prompt, count=1)
+
     @staticmethod
     def _format_value(value: Any) -> Any:
         """Return a placeholder when a value is missing."""
@@ -121,9 +182,14 @@ class PromptBuilder:
     def _format_series(series: Any) -> str:
         """Format a sequence for display in the prompt."""
 
+        if isinstance(series, (list, tuple)):
+            # Indicator series arrive as ``Series.tail(n).tolist()`` lists
+            return orjson.dumps(series, option=_JSON_OPTIONS).decode()
+        if isinstance(series, np.ndarray) and series.flags.c_contiguous:
+            return orjson.dumps(series, option=_JSON_OPTIONS).decode()
         if isinstance(series, Iterable) and not isinstance(series, (str, bytes, dict)):
-            return json.dumps(list(series))
-        return json.dumps([]) if series is None else json.dumps(series)
+            return orjson.dumps(list(series), option=_JSON_OPTIONS).decode()
+        return "[]" if series is None else orjson.dumps(series, option=_JSON_OPTIONS).decode()
 
 
-__all__ = ["PromptBuilder"]
+__all__ = ["MARKET_STATE_TITLE", "PromptBuilder", "STATIC_HEADER"]
@@ -3,13 +3,129 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+import orjson
 
 from src.logger import log
 
 
-REQUIRED_FIELDS = {"symbol", "action"}
-VALID_ACTIONS = {"BUY", "SELL", "HOLD"}
+REQUIRED_FIELDS = frozenset({"symbol", "action"})
+VALID_ACTIONS = frozenset({"BUY", "SELL", "HOLD"})
+_VALID_ENTRY_TYPES = frozenset({"MARKET", "LIMIT"})
+
+
+class JsonStreamScanner:
+    """Accumulate streamed text and detect when the first JSON value is complete.
+
+    Text before the opening bracket is kept (the parser tolerates it) and
+    anything after the matching closing bracket is discarded, which lets a
+    caller stop reading a model stream as soon as the decision JSON closes.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+        self.complete = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk of text and return ``True`` once the value has closed."""
+
+        if self.complete:
+            return True
+
+        for index, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char in "[{":
+                self._depth += 1
+                self._started = True
+            elif not self._started:
+                continue
+            elif char == '"':
+                self._in_string = True
+            elif char in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[: index + 1])
+                    self.complete = True
+                    return True
+
+        self._parts.append(chunk)
+        return False
+
+
+def _loads(response: Any) -> Any:
+    """Decode a JSON payload, passing str/bytes to orjson without coercion."""
+
+    if isinstance(response, (str, bytes, bytearray, memoryview)):
+        return orjson.loads(response)
+    return orjson.loads(str(response))
+
+
+def _salvage_decisions(text: str) -> List[Any]:
+    """Recover the complete leading objects of a truncated JSON array."""
+
+    decoder = json.JSONDecoder()
+    start = text.find("[")
+    if start < 0:
+        return []
+
+    decisions: List[Any] = []
+    index = start + 1
+    while True:
+        index = text.find("{", index)
+        if index < 0:
+            break
+        try:
+            item, index = decoder.raw_decode(text, index)
+        except json.JSONDecodeError:
+            break
+        decisions.append(item)
+    return decisions
+
+
+def parse_ai_decisions(response: Any) -> List[Dict[str, Any]]:
+    """Parse a response containing one decision per coin.
+
+    Accepts a JSON array (or list) of decision objects as well as a single
+    decision object. When the array was cut off mid-way (e.g. the model hit
+    its token limit), the complete decisions before the cut are kept.
+    """
+
+    if isinstance(response, (dict, list)):
+        data = response
+    else:
+        try:
+            data = _loads(response)
+        except orjson.JSONDecodeError:
+            if isinstance(response, (bytes, bytearray, memoryview)):
+                text = bytes(response).decode("utf-8", errors="replace")
+            else:
+                text = str(response)
+            data = _salvage_decisions(text)
+            if data:
+                log.warning("AI response was truncated, recovered {} decisions", len(data))
+
+    if isinstance(data, dict):
+        return [parse_ai_response(data)]
+    if not isinstance(data, list) or not data:
+        log.warning("Failed to decode AI response, defaulting to HOLD decision")
+        return [parse_ai_response({})]
+
+    return [parse_ai_response(item) for item in data if isinstance(item, dict)]
 
 
 def parse_ai_response(response: Any) -> Dict[str, Any]:
@@ -25,18 +141,33 @@ def parse_ai_response(response: Any) -> Dict[str, Any]:
         data = response
     else:
         try:
-            data = json.loads(str(response))
-        except json.JSONDecodeError:
+            data = _loads(response)
+        except orjson.JSONDecodeError:
             log.warning("Failed to decode AI response, defaulting to HOLD decision")
             data = {}
 
-    # Normalise keys
-    normalized = {str(k).lower(): v for k, v in data.items()}
-
-    action = str(normalized.get("action", "HOLD")).upper()
-    if action not in VALID_ACTIONS:
-        log.warning("Invalid AI action '%s', defaulting to HOLD", action)
-        action = "HOLD"
+    if not isinstance(data, dict):
+        log.warning("AI response is not a JSON object, defaulting to HOLD decision")
+        data = {}
+
+    # Normalise keys (models almost always emit lowercase already)
+    normalized = data
+    if any(not isinstance(k, str) or k != k.lower() for k in data):
+        normalized = {str(k).lower(): v for k, v in data.items()}
+
+    # The model is instructed to answer in uppercase, so only normalise on a miss
+    action = normalized.get("action", "HOLD")
+    if not isinstance(action, str) or action not in VALID_ACTIONS:
+        action = str(action).upper()
+        if action not in VALID_ACTIONS:
+            log.warning("Invalid AI action '{}', defaulting to HOLD", action)
+            action = "HOLD"
+
+    entry_type = normalized.get("entry_type", "MARKET")
+    if not isinstance(entry_type, str) or entry_type not in _VALID_ENTRY_TYPES:
+        entry_type = str(entry_type).upper()
+        if entry_type not in _VALID_ENTRY_TYPES:
+            entry_type = "MARKET"
 
     symbol = normalized.get("symbol")
     if not symbol:
@@ -47,7 +178,7 @@ def parse_ai_response(response: Any) -> Dict[str, Any]:
         "action": action,
         "confidence": float(normalized.get("confidence", 0.0) or 0.0),
         "reasoning": normalized.get("reasoning", "No reasoning provided."),
-        "entry_type": str(normalized.get("entry_type", "MARKET")).upper(),
+        "entry_type": entry_type,
         "entry_price": normalized.get("entry_price"),
         "stop_loss": normalized.get("stop_loss"),
         "take_profit": normalized.get("take_profit"),
@@ -60,4 +191,4 @@ def parse_ai_response(response: Any) -> Dict[str, Any]:
     return result
 
 
-__all__ = ["parse_ai_response"]
+__all__ = ["JsonStreamScanner", "parse_ai_decisions", "parse_ai_response"]
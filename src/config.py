@@ -1,10 +1,18 @@
 """Configuration management using Pydantic settings."""
 
-from typing import List, Literal
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Literal, Optional, Tuple
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Relative data paths in the settings resolve against the repository root,
+# not the current working directory.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Runtime state (mock exchange, portfolio history, caches) lives here
+DATA_DIR = PROJECT_ROOT / "data"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -19,6 +27,8 @@ class Settings(BaseSettings):
     # Exchange Configuration
     exchange: Literal["mock", "deribit", "coinbase"] = Field(default="mock")
     environment: Literal["testnet", "production"] = Field(default="testnet")
+    # WebSocket market data only pays off when one process runs many iterations
+    exchange_streams: bool = Field(default=False)
 
     # Deribit API Keys
     deribit_testnet_api_key: str = Field(default="")
@@ -34,6 +44,8 @@ class Settings(BaseSettings):
     ai_model: Literal["mock", "claude", "openai"] = Field(default="mock")
     anthropic_api_key: str = Field(default="")
     openai_api_key: str = Field(default="")
+    response_cache_ttl: int = Field(default=0, ge=0)  # seconds, 0 disables
+    response_cache_path: str = Field(default="data/response_cache.sqlite")  # empty disables
 
     # Trading Configuration
     initial_balance: float = Field(default=10_000.0)
@@ -52,19 +64,36 @@ class Settings(BaseSettings):
     max_drawdown_pct: float = Field(default=20.0, ge=1, le=100)
     position_size_pct: float = Field(default=20.0, ge=1, le=100)
 
+    # Market Data
+    ohlcv_cache_path: str = Field(default="")  # e.g. data/ohlcv_cache.sqlite, empty disables
+    # seconds; the bot restarts every run interval, so this must outlive it
+    ohlcv_disk_cache_ttl: int = Field(default=600, ge=1)
+
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(default="INFO")
     log_file: str = Field(default="logs/trading_bot.log")
 
-    @property
-    def symbol_list(self) -> List[str]:
-        """Parse symbols from comma-separated string."""
+    @cached_property
+    def symbol_list(self) -> Tuple[str, ...]:
+        """Parse symbols from comma-separated string (computed once)."""
+
+        return tuple(s.strip() for s in self.symbols.split(",") if s.strip())
+
+    @cached_property
+    def ohlcv_cache_file(self) -> Optional[Path]:
+        """OHLCV disk cache location under the project root, or ``None`` when disabled."""
+
+        return PROJECT_ROOT / self.ohlcv_cache_path if self.ohlcv_cache_path else None
 
-        return [s.strip() for s in self.symbols.split(",") if s.strip()]
+    @cached_property
+    def response_cache_file(self) -> Optional[Path]:
+        """AI response cache location under the project root, or ``None`` when disabled."""
 
-    @property
+        return PROJECT_ROOT / self.response_cache_path if self.response_cache_path else None
+
+    @cached_property
     def exchange_api_key(self) -> str:
-        """Get the appropriate API key based on exchange and environment."""
+        """Get the appropriate API key based on exchange and environment (resolved once)."""
         if self.exchange == "mock":
             return ""
         if self.exchange == "deribit":
@@ -75,9 +104,9 @@ class Settings(BaseSettings):
             return self.coinbase_api_key
         return ""
 
-    @property
+    @cached_property
     def exchange_secret(self) -> str:
-        """Get the appropriate secret based on exchange and environment."""
+        """Get the appropriate secret based on exchange and environment (resolved once)."""
         if self.exchange == "mock":
             return ""
         if self.exchange == "deribit":
@@ -110,5 +139,16 @@ class Settings(BaseSettings):
             raise ValueError(message)
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading ``.env`` on first use."""
+
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    # ``from src.config import settings`` keeps working, but the settings are
+    # only parsed once something actually asks for them.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
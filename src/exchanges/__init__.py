@@ -1,26 +1,36 @@
 """Exchange abstraction layer providing a unified exchange interface."""
 
-from src.config import settings
+from typing import Any
+
+from src.config import get_settings
 from src.logger import log
 from src.exchanges.base import BaseExchange
-from src.exchanges.deribit_exchange import DeribitExchange
-from src.exchanges.mock_exchange import MockExchange
 
 
 def get_exchange() -> BaseExchange:
     """Factory function that returns the configured exchange implementation."""
 
+    settings = get_settings()
     exchange_name = settings.exchange.lower()
 
+    # Implementations are imported per branch so that paper trading never
+    # loads ccxt and a live Deribit run never loads the CoinGecko fetcher.
     if exchange_name == "mock":
+        from src.exchanges.mock_exchange import MockExchange
+
         log.info("Using mock exchange (paper trading mode)")
-        return MockExchange()
+        # The trading loop fetches market data right away; open the
+        # CoinGecko connection while the rest of the bot starts up.
+        return MockExchange(warm_up=True)
 
     if exchange_name == "deribit":
+        from src.exchanges.deribit_exchange import DeribitExchange
+
         return DeribitExchange(
             api_key=settings.exchange_api_key,
             secret=settings.exchange_secret,
             testnet=settings.environment == "testnet",
+            streams=settings.exchange_streams,
         )
 
     if exchange_name == "coinbase":
@@ -29,4 +39,16 @@ def get_exchange() -> BaseExchange:
     raise ValueError(f"Unsupported exchange configured: {settings.exchange}")
 
 
+def __getattr__(name: str) -> Any:
+    if name == "DeribitExchange":
+        from src.exchanges.deribit_exchange import DeribitExchange
+
+        return DeribitExchange
+    if name == "MockExchange":
+        from src.exchanges.mock_exchange import MockExchange
+
+        return MockExchange
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["BaseExchange", "DeribitExchange", "MockExchange", "get_exchange"]
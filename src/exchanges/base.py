@@ -1,12 +1,23 @@
 """Base exchange interface for abstraction"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
 
-@dataclass
+
+@lru_cache(maxsize=1024)
+def perpetual_symbol(symbol: str) -> str:
+    """Return ``symbol`` in ``<COIN>-PERPETUAL`` form (memoised per input)"""
+    if symbol.endswith("-PERPETUAL"):
+        return symbol
+    return f"{symbol}-PERPETUAL"
+
+
+@dataclass(slots=True)
 class OHLCV:
     """OHLCV candle data"""
     timestamp: datetime
@@ -17,15 +28,60 @@ class OHLCV:
     volume: float
 
 
-@dataclass
-class OrderBook:
-    """Order book snapshot"""
-    timestamp: datetime
-    bids: List[tuple]  # [(price, size), ...]
-    asks: List[tuple]
+def ohlcv_from_rows(rows: Iterable[Sequence[float]]) -> List[OHLCV]:
+    """Convert ``[timestamp_ms, open, high, low, close, volume]`` rows in one batch"""
+    if not isinstance(rows, (list, tuple, np.ndarray)):
+        rows = list(rows)
+    table = np.asarray(rows, dtype=np.float64)
+    if not table.size:
+        return []
+    # Columns are turned into Python floats once instead of per field per row;
+    # timestamps stay naive local datetimes as before.
+    timestamps = map(datetime.fromtimestamp, (table[:, 0] / 1000).tolist())
+    return list(map(OHLCV, timestamps, *table[:, 1:6].T.tolist()))
 
 
-@dataclass
+def _split_levels(levels: Sequence[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split ``[(price, size), ...]`` levels into price and size arrays"""
+    if not len(levels):
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+    table = np.asarray([level[:2] for level in levels], dtype=np.float64)
+    return np.ascontiguousarray(table[:, 0]), np.ascontiguousarray(table[:, 1])
+
+
+@dataclass(slots=True)
+class OrderBook:
+    """Order book snapshot stored as parallel price/size arrays"""
+    timestamp: datetime
+    bid_px: np.ndarray
+    bid_sz: np.ndarray
+    ask_px: np.ndarray
+    ask_sz: np.ndarray
+
+    @classmethod
+    def from_levels(
+        cls,
+        timestamp: datetime,
+        bids: Sequence[Sequence[float]],
+        asks: Sequence[Sequence[float]],
+    ) -> "OrderBook":
+        """Build a snapshot from ``[(price, size), ...]`` level lists"""
+        bid_px, bid_sz = _split_levels(bids)
+        ask_px, ask_sz = _split_levels(asks)
+        return cls(timestamp, bid_px, bid_sz, ask_px, ask_sz)
+
+    @property
+    def bids(self) -> List[tuple]:
+        """Bid levels as ``[(price, size), ...]`` for legacy callers"""
+        return list(zip(self.bid_px.tolist(), self.bid_sz.tolist()))
+
+    @property
+    def asks(self) -> List[tuple]:
+        """Ask levels as ``[(price, size), ...]`` for legacy callers"""
+        return list(zip(self.ask_px.tolist(), self.ask_sz.tolist()))
+
+
+@dataclass(slots=True)
 class Position:
     """Open position information"""
     symbol: str
@@ -38,7 +94,7 @@ class Position:
     leverage: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order information"""
     order_id: str
@@ -50,7 +106,7 @@ class Order:
     status: str = "pending"  # "pending", "filled", "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     """Account balance"""
     total: float
@@ -58,13 +114,16 @@ class Balance:
     in_positions: float
 
 
+@dataclass(slots=True, eq=False)
 class BaseExchange(ABC):
     """Abstract base class for exchange implementations"""
+    api_key: str = field(repr=False)
+    secret: str = field(repr=False)
+    testnet: bool = True
 
-    def __init__(self, api_key: str, secret: str, testnet: bool = True):
-        self.api_key = api_key
-        self.secret = secret
-        self.testnet = testnet
+    async def close(self) -> None:
+        """Release network clients and background tasks (no-op by default)"""
+        return None
 
     @abstractmethod
     async def get_ohlcv(
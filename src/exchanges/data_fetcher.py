@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import math
+import sqlite3
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from threading import Lock
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from weakref import WeakSet
+
+import numpy as np
+import orjson
 import requests
 from requests import Response
 from requests.adapters import HTTPAdapter
@@ -16,12 +23,21 @@ from urllib3.util.retry import Retry
 from src.logger import log
 
 
-@dataclass
+# Sessions that already carry this module's adapters, so fetchers sharing a
+# session do not remount them (and clobber any later customisation).
+_configured_sessions: "WeakSet[requests.Session]" = WeakSet()
+
+# Bumped whenever the on-disk OHLCV table changes shape; the cache is
+# disposable, so an old table is dropped rather than migrated.
+_DISK_SCHEMA_VERSION = 2
+
+
+@dataclass(slots=True)
 class _CacheEntry:
-    """Simple container for cached values with an expiry timestamp."""
+    """Simple container for cached values with a monotonic expiry (nanoseconds)."""
 
     value: Any
-    expires_at: datetime
+    expires_at: int
 
 
 class MarketDataFetcher:
@@ -32,15 +48,30 @@ class MarketDataFetcher:
         session: Optional[requests.Session] = None,
         price_ttl: int = 30,
         ohlcv_ttl: int = 60,
+        warm_up: bool = False,
+        cache_path: Optional[Union[str, Path]] = None,
+        disk_ttl: Optional[int] = None,
     ) -> None:
         self.coingecko_base = "https://api.coingecko.com/api/v3"
         self.session = session or requests.Session()
-        self.price_cache_ttl = timedelta(seconds=max(price_ttl, 1))
-        self.ohlcv_cache_ttl = timedelta(seconds=max(ohlcv_ttl, 1))
+        self.price_cache_ttl_ns = max(price_ttl, 1) * 1_000_000_000
+        self.ohlcv_cache_ttl_ns = max(ohlcv_ttl, 1) * 1_000_000_000
+        # Disk entries have to survive process restarts, so they get their
+        # own (normally longer) lifetime; defaults to the in-memory TTL.
+        self.disk_cache_ttl = max(ohlcv_ttl if disk_ttl is None else disk_ttl, 1)
 
         self._price_cache: Dict[str, _CacheEntry] = {}
         self._ohlcv_cache: Dict[Tuple[str, int, int], _CacheEntry] = {}
         self._cache_lock = Lock()
+        self._norm_cache: Dict[str, Tuple[str, str]] = {}
+        # In-flight async price refreshes, so concurrent callers share one request
+        self._price_inflight: Dict[str, asyncio.Task] = {}
+
+        # Optional on-disk OHLCV cache so restarts do not refetch candles.
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_lock = Lock()
+        if cache_path:
+            self._open_disk_cache(Path(cache_path))
 
         self._configure_session(self.session)
 
@@ -54,56 +85,92 @@ class MarketDataFetcher:
             "DOGE-PERPETUAL": "dogecoin",
         }
 
+        if warm_up:
+            # Off the constructor's path, so the TLS handshake overlaps with
+            # the rest of start-up instead of delaying it.
+            Thread(target=self._warm_up, name="coingecko-warm-up", daemon=True).start()
+
     def _configure_session(self, session: requests.Session) -> None:
         """Configure retry/backoff strategy and default headers."""
 
+        if session in _configured_sessions:
+            return
+
         retry = Retry(
             total=3,
             status_forcelist=(429, 500, 502, 503, 504),
             backoff_factor=0.5,
             allowed_methods=("GET",),
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # The async helpers fan requests out over worker threads, so keep
+        # enough pooled keep-alive connections for every symbol at once.
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=4,
+            pool_maxsize=16,
+            pool_block=False,
+        )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         session.headers.setdefault(
             "User-Agent",
             "ai-stock-assist/market-data-fetcher",
         )
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        _configured_sessions.add(session)
+
+    def _warm_up(self) -> None:
+        """Open the pooled TLS connection before the first real request."""
 
-    def _now(self) -> datetime:
-        return datetime.utcnow()
+        try:
+            self.session.get(f"{self.coingecko_base}/ping", timeout=10)
+        except Exception as exc:
+            log.warning("CoinGecko warm-up request failed: {}", exc)
 
     def _get_cached(self, cache: Dict[Any, _CacheEntry], key: Any) -> Optional[Any]:
         """Return cached value if present and not expired."""
 
-        with self._cache_lock:
-            entry = cache.get(key)
-            if not entry:
-                return None
-            if entry.expires_at <= self._now():
-                cache.pop(key, None)
-                return None
+        # dict.get is atomic under the GIL and entries are replaced, never
+        # mutated, so hits need no lock; only eviction takes it.
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at > time.monotonic_ns():
             return entry.value
 
+        with self._cache_lock:
+            # Another thread may have stored a fresh entry in the meantime.
+            if cache.get(key) is entry:
+                del cache[key]
+        return None
+
     def _set_cache(
         self,
         cache: Dict[Any, _CacheEntry],
         key: Any,
         value: Any,
-        ttl: timedelta,
+        ttl_ns: int,
     ) -> None:
         with self._cache_lock:
-            cache[key] = _CacheEntry(value=value, expires_at=self._now() + ttl)
+            cache[key] = _CacheEntry(value=value, expires_at=time.monotonic_ns() + ttl_ns)
+
+    def _norm(self, symbol: str) -> Tuple[str, str]:
+        """Return ``(cache_key, coingecko_id)`` for a symbol, memoised per raw string."""
+
+        normalized = self._norm_cache.get(symbol)
+        if normalized is None:
+            cache_key = symbol.upper()
+            coin_id = self.symbol_to_coingecko.get(
+                cache_key,
+                cache_key.lower().replace("-perpetual", ""),
+            )
+            normalized = self._norm_cache[symbol] = (cache_key, coin_id)
+        return normalized
 
     def _get_coingecko_id(self, symbol: str) -> str:
         """Convert internal symbol format (e.g. BTC-PERPETUAL) to CoinGecko ID."""
 
-        normalized = symbol.upper()
-        return self.symbol_to_coingecko.get(
-            normalized,
-            normalized.lower().replace("-perpetual", ""),
-        )
+        return self._norm(symbol)[1]
 
     def _simple_price_request(self, coin_ids: Iterable[str]) -> Dict[str, Any]:
         url = f"{self.coingecko_base}/simple/price"
@@ -114,67 +181,102 @@ class MarketDataFetcher:
 
         response = self.session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_current_price(self, symbol: str) -> float:
         """Get the latest USD price for a single symbol."""
 
-        cache_key = symbol.upper()
+        cache_key, coin_id = self._norm(symbol)
         cached = self._get_cached(self._price_cache, cache_key)
         if cached is not None:
             return float(cached)
 
         try:
-            coin_id = self._get_coingecko_id(symbol)
             data = self._simple_price_request([coin_id])
             price = float(data[coin_id]["usd"])
-            self._set_cache(self._price_cache, cache_key, price, self.price_cache_ttl)
-            log.debug(f"Fetched price for {symbol}: ${price:.4f}")
+            self._set_cache(self._price_cache, cache_key, price, self.price_cache_ttl_ns)
+            log.debug("Fetched price for {}: ${:.4f}", symbol, price)
             return price
 
         except Exception as exc:
-            log.error(f"Error fetching price for {symbol}: {exc}")
+            log.error("Error fetching price for {}: {}", symbol, exc)
             raise
 
     def get_multiple_prices(self, symbols: List[str]) -> Dict[str, float]:
         """Fetch prices for multiple symbols, reusing cached values when possible."""
 
         results: Dict[str, float] = {}
-        uncached: List[str] = []
+        uncached: List[Tuple[str, str, str]] = []
 
         for symbol in symbols:
-            cache_key = symbol.upper()
+            cache_key, coin_id = self._norm(symbol)
             cached = self._get_cached(self._price_cache, cache_key)
             if cached is not None:
                 results[symbol] = float(cached)
             else:
-                uncached.append(symbol)
+                uncached.append((symbol, cache_key, coin_id))
 
         if not uncached:
             return results
 
         try:
-            id_map = {symbol: self._get_coingecko_id(symbol) for symbol in uncached}
-            data = self._simple_price_request(id_map.values())
+            data = self._simple_price_request([coin_id for _, _, coin_id in uncached])
 
-            for symbol, coin_id in id_map.items():
+            for symbol, cache_key, coin_id in uncached:
                 price = float(data.get(coin_id, {}).get("usd", 0.0))
                 if price:
                     results[symbol] = price
                     self._set_cache(
                         self._price_cache,
-                        symbol.upper(),
+                        cache_key,
                         price,
-                        self.price_cache_ttl,
+                        self.price_cache_ttl_ns,
                     )
 
             return results
 
         except Exception as exc:
-            log.error(f"Error fetching multiple prices: {exc}")
+            log.error("Error fetching multiple prices: {}", exc)
             return results
 
-    def _fetch_market_chart(self, coin_id: str, days: int, interval: str) -> Dict[str, Any]:
+    async def aget_price(self, symbol: str) -> float:
+        """Async single price lookup served from the price cache while it is fresh.
+
+        Concurrent misses for the same symbol wait on one shared refresh
+        instead of each issuing their own request.
+        """
+
+        cache_key, _ = self._norm(symbol)
+        cached = self._get_cached(self._price_cache, cache_key)
+        if cached is not None:
+            return float(cached)
+
+        task = self._price_inflight.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(asyncio.to_thread(self.get_current_price, symbol))
+            self._price_inflight[cache_key] = task
+
+            def _forget(done: asyncio.Task) -> None:
+                if self._price_inflight.get(cache_key) is done:
+                    del self._price_inflight[cache_key]
+
+            task.add_done_callback(_forget)
+        return await asyncio.shield(task)
+
+    async def aget_prices(self, symbols: Iterable[str]) -> Dict[str, float]:
+        """Async batch price lookup: one CoinGecko request for every uncached symbol."""
+
+        symbols = list(symbols)
+        results = await asyncio.to_thread(self.get_multiple_prices, symbols)
+        missing = [symbol for symbol in symbols if symbol not in results]
+        if missing:
+            # The batch endpoint skips unknown or failed ids; retry those
+            # individually so errors surface exactly as get_current_price's do.
+            prices = await asyncio.gather(*(self.aget_price(symbol) for symbol in missing))
+            results.update(zip(missing, prices))
+        return results
+
+    def _fetch_market_chart(self, coin_id: str, days: int, interval: str) -> Dict[str, np.ndarray]:
         url = f"{self.coingecko_base}/coins/{coin_id}/market_chart"
         params = {
             "vs_currency": "usd",
@@ -184,9 +286,26 @@ class MarketDataFetcher:
 
         response: Response = self.session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        return response.json()
+        payload = orjson.loads(response.content)
+
+        # Pack the two series we aggregate into (N, 2) float64 arrays right
+        # away so the nested lists (and the unused market_caps series) can be
+        # released before aggregation.
+        return {
+            key: self._as_points(payload.get(key))
+            for key in ("prices", "total_volumes")
+        }
+
+    @staticmethod
+    def _as_points(values: Any) -> np.ndarray:
+        """Return ``[[ts, value], ...]`` as an ``(N, 2)`` float64 array."""
+
+        return np.asarray(values if values is not None else (), dtype=np.float64).reshape(-1, 2)
 
-    def _determine_days(self, timeframe_minutes: int, limit: int) -> int:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _determine_days(timeframe_minutes: int, limit: int) -> int:
+        # Only a handful of (timeframe, limit) pairs occur, so memoise them.
         total_minutes = max(1, timeframe_minutes) * max(1, limit)
         if timeframe_minutes <= 60:
             estimated_days = math.ceil(total_minutes / (60 * 24))
@@ -196,64 +315,184 @@ class MarketDataFetcher:
         estimated_days = math.ceil(total_hours / 24)
         return max(1, min(90, estimated_days))
 
+    @staticmethod
+    def _granularity(days: int) -> int:
+        """CoinGecko's point spacing band for ``days``: 5-minute, hourly or daily."""
+
+        if days <= 1:
+            return 0
+        return 1 if days <= 90 else 2
+
     def _aggregate_ohlcv(
         self,
-        prices: List[List[float]],
-        volumes: List[List[float]],
+        prices: Union[np.ndarray, List[List[float]]],
+        volumes: Union[np.ndarray, List[List[float]]],
         timeframe_minutes: int,
     ) -> List[Dict[str, float]]:
-        if not prices:
+        if len(prices) == 0:
             return []
 
         timeframe_ms = max(1, timeframe_minutes) * 60 * 1000
-        volume_map = {int(ts): float(vol) for ts, vol in volumes}
-
-        aggregated: List[Dict[str, float]] = []
-        bucket_prices: List[Tuple[int, float]] = []
-        bucket_volumes: List[float] = []
-        bucket_start: Optional[int] = None
-
-        for ts, price in sorted(prices, key=lambda item: item[0]):
-            timestamp = int(ts)
-            bucket_id = (timestamp // timeframe_ms) * timeframe_ms
-
-            if bucket_start is None:
-                bucket_start = bucket_id
-
-            if bucket_id != bucket_start and bucket_prices:
-                aggregated.append(self._compose_candle(bucket_start, bucket_prices, bucket_volumes))
-                bucket_prices = []
-                bucket_volumes = []
-                bucket_start = bucket_id
+        points = np.asarray(prices, dtype=np.float64)
+        raw_timestamps = points[:, 0].astype(np.int64)
+        # CoinGecko already returns points in time order; only sort if not.
+        order: Union[np.ndarray, slice]
+        if (raw_timestamps[1:] < raw_timestamps[:-1]).any():
+            order = np.argsort(raw_timestamps, kind="stable")
+        else:
+            order = slice(None)
+        timestamps = raw_timestamps[order]
+        price_values = points[order, 1]
+        volume_values = self._align_volumes(volumes, raw_timestamps, timestamps, order)
+
+        # Points are sorted, so each bucket is a contiguous run and the
+        # per-bucket reductions can be done with reduceat over the run starts.
+        buckets = (timestamps // timeframe_ms) * timeframe_ms
+        starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+        ends = np.append(starts[1:], len(buckets)) - 1
+
+        columns = zip(
+            buckets[starts].astype(np.float64).tolist(),
+            price_values[starts].tolist(),
+            np.maximum.reduceat(price_values, starts).tolist(),
+            np.minimum.reduceat(price_values, starts).tolist(),
+            price_values[ends].tolist(),
+            np.add.reduceat(volume_values, starts).tolist(),
+        )
+        return [
+            {
+                "timestamp": timestamp,
+                "open": open_price,
+                "high": high_price,
+                "low": low_price,
+                "close": close_price,
+                "volume": volume,
+            }
+            for timestamp, open_price, high_price, low_price, close_price, volume in columns
+        ]
 
-            bucket_prices.append((timestamp, float(price)))
-            bucket_volumes.append(volume_map.get(timestamp, 0.0))
+    @staticmethod
+    def _align_volumes(
+        volumes: Union[np.ndarray, List[List[float]]],
+        raw_timestamps: np.ndarray,
+        timestamps: np.ndarray,
+        order: Union[np.ndarray, slice],
+    ) -> np.ndarray:
+        """Return the volume for each sorted price point (0.0 where missing)."""
+
+        if len(volumes) == 0:
+            return np.zeros(len(timestamps), dtype=np.float64)
+
+        table = np.asarray(volumes, dtype=np.float64)
+        volume_ts = table[:, 0].astype(np.int64)
+        volume_values = table[:, 1]
+
+        # CoinGecko emits both series on the same timestamps, so the common
+        # case is a straight positional reorder.
+        if np.array_equal(volume_ts, raw_timestamps):
+            return volume_values[order]
+
+        volume_order = np.argsort(volume_ts, kind="stable")
+        volume_ts = volume_ts[volume_order]
+        volume_values = volume_values[volume_order]
+        idx = np.searchsorted(volume_ts, timestamps, side="right") - 1
+        np.clip(idx, 0, None, out=idx)
+        matched = volume_ts[idx] == timestamps
+        return np.where(matched, volume_values[idx], 0.0)
+
+    def _open_disk_cache(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            disk = sqlite3.connect(path, check_same_thread=False)
+            if disk.execute("PRAGMA user_version").fetchone()[0] != _DISK_SCHEMA_VERSION:
+                disk.execute("DROP TABLE IF EXISTS ohlcv")
+                disk.execute(f"PRAGMA user_version = {_DISK_SCHEMA_VERSION}")
+            disk.execute(
+                "CREATE TABLE IF NOT EXISTS ohlcv ("
+                " symbol TEXT NOT NULL,"
+                " timeframe INTEGER NOT NULL,"
+                " granularity INTEGER NOT NULL,"
+                " days INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " candles BLOB NOT NULL,"
+                " PRIMARY KEY (symbol, timeframe, granularity))"
+            )
+            disk.commit()
+            self._disk = disk
+        except sqlite3.Error as exc:
+            log.warning("OHLCV disk cache disabled ({}): {}", path, exc)
 
-        if bucket_prices and bucket_start is not None:
-            aggregated.append(self._compose_candle(bucket_start, bucket_prices, bucket_volumes))
+    def _load_disk_ohlcv(self, cache_key: Tuple[str, int, int]) -> bool:
+        """Promote a still-fresh disk entry into the in-memory cache."""
 
-        return aggregated
+        try:
+            with self._disk_lock:
+                row = self._disk.execute(
+                    "SELECT days, expires_at, candles FROM ohlcv"
+                    " WHERE symbol = ? AND timeframe = ? AND granularity = ?",
+                    cache_key,
+                ).fetchone()
+        except sqlite3.Error as exc:
+            log.warning("OHLCV disk cache read failed: {}", exc)
+            return False
+
+        if row is None:
+            return False
+        days, expires_at, payload = row
+        # Disk entries outlive the process, so their expiry is wall-clock time.
+        remaining_ns = int((expires_at - time.time()) * 1_000_000_000)
+        if remaining_ns <= 0:
+            return False
+
+        self._set_cache(
+            self._ohlcv_cache,
+            cache_key,
+            (days, tuple(orjson.loads(payload))),
+            min(remaining_ns, self.ohlcv_cache_ttl_ns),
+        )
+        return True
 
-    @staticmethod
-    def _compose_candle(
-        bucket_start: int,
-        price_points: List[Tuple[int, float]],
-        volume_points: List[float],
-    ) -> Dict[str, float]:
-        open_price = price_points[0][1]
-        close_price = price_points[-1][1]
-        high_price = max(p[1] for p in price_points)
-        low_price = min(p[1] for p in price_points)
-        volume_total = float(sum(volume_points)) if volume_points else 0.0
+    def _store_disk_ohlcv(
+        self,
+        cache_key: Tuple[str, int, int],
+        days: int,
+        candles: List[Dict[str, float]],
+    ) -> None:
+        expires_at = time.time() + self.disk_cache_ttl
+        try:
+            with self._disk_lock:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?)",
+                    (*cache_key, days, expires_at, orjson.dumps(candles)),
+                )
+                self._disk.commit()
+        except sqlite3.Error as exc:
+            log.warning("OHLCV disk cache write failed: {}", exc)
+
+    def _get_cached_ohlcv(
+        self,
+        symbol: str,
+        timeframe_minutes: int,
+        limit: int,
+    ) -> Optional[List[Dict[str, float]]]:
+        """Slice cached candles if the cached fetch covered ``limit`` candles."""
 
-        return {
-            "timestamp": float(bucket_start),
-            "open": float(open_price),
-            "high": float(high_price),
-            "low": float(low_price),
-            "close": float(close_price),
-            "volume": volume_total,
-        }
+        days = self._determine_days(timeframe_minutes, limit)
+        cached = self._get_cached(
+            self._ohlcv_cache, self._ohlcv_key(symbol, timeframe_minutes, days)
+        )
+        if cached is None:
+            return None
+        cached_days, candles = cached
+        # A larger limit may need a wider history window than was fetched.
+        if days > cached_days:
+            return None
+        return list(candles[-limit:])
+
+    def _ohlcv_key(self, symbol: str, timeframe_minutes: int, days: int) -> Tuple[str, int, int]:
+        # A wider window comes back with coarser points, so candles are only
+        # shared between requests in the same CoinGecko granularity band.
+        return (self._norm(symbol)[0], timeframe_minutes, self._granularity(days))
 
     def get_ohlcv(
         self,
@@ -263,37 +502,76 @@ class MarketDataFetcher:
     ) -> List[Dict[str, float]]:
         """Get OHLCV data for a symbol aggregated to the requested timeframe."""
 
-        cache_key = (symbol.upper(), timeframe_minutes, limit)
-        cached = self._get_cached(self._ohlcv_cache, cache_key)
+        cached = self._get_cached_ohlcv(symbol, timeframe_minutes, limit)
         if cached is not None:
-            return list(cached)
+            return cached
+
+        coin_id = self._norm(symbol)[1]
+        days = self._determine_days(timeframe_minutes, limit)
+        cache_key = self._ohlcv_key(symbol, timeframe_minutes, days)
+        if self._disk is not None and self._load_disk_ohlcv(cache_key):
+            cached = self._get_cached_ohlcv(symbol, timeframe_minutes, limit)
+            if cached is not None:
+                return cached
 
         try:
-            coin_id = self._get_coingecko_id(symbol)
             interval = "minutely" if timeframe_minutes <= 60 else "hourly"
-            days = self._determine_days(timeframe_minutes, limit)
             raw = self._fetch_market_chart(coin_id, days, interval)
 
             ohlcv = self._aggregate_ohlcv(
-                raw.get("prices", []),
-                raw.get("total_volumes", []),
+                raw.get("prices", ()),
+                raw.get("total_volumes", ()),
                 timeframe_minutes,
             )
 
+            self._set_cache(
+                self._ohlcv_cache,
+                cache_key,
+                (days, tuple(ohlcv)),
+                self.ohlcv_cache_ttl_ns,
+            )
+            if self._disk is not None:
+                self._store_disk_ohlcv(cache_key, days, ohlcv)
             result = ohlcv[-limit:]
-            self._set_cache(self._ohlcv_cache, cache_key, result, self.ohlcv_cache_ttl)
-            log.debug(f"Fetched {len(result)} candles for {symbol} ({timeframe_minutes}m)")
+            log.debug("Fetched {} candles for {} ({}m)", len(result), symbol, timeframe_minutes)
             return result
 
         except Exception as exc:
-            log.error(f"Error fetching OHLCV for {symbol}: {exc}")
+            log.error("Error fetching OHLCV for {}: {}", symbol, exc)
             raise
 
+    async def aget_ohlcv(
+        self,
+        symbol: str,
+        timeframe_minutes: int = 3,
+        limit: int = 100,
+    ) -> List[Dict[str, float]]:
+        """Async variant of :meth:`get_ohlcv` that keeps the event loop free."""
+
+        cached = self._get_cached_ohlcv(symbol, timeframe_minutes, limit)
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.get_ohlcv, symbol, timeframe_minutes, limit)
+
+    async def aget_many_ohlcv(
+        self,
+        symbols: Iterable[str],
+        timeframe_minutes: int = 3,
+        limit: int = 100,
+    ) -> Dict[str, List[Dict[str, float]]]:
+        """Fetch OHLCV for several symbols with the HTTP round-trips overlapped."""
+
+        symbols = list(symbols)
+        results = await asyncio.gather(
+            *(self.aget_ohlcv(symbol, timeframe_minutes, limit) for symbol in symbols)
+        )
+        return dict(zip(symbols, results))
+
     def _fetch_coin_detail(self, coin_id: str) -> Dict[str, Any]:
         url = f"{self.coingecko_base}/coins/{coin_id}"
         response = self.session.get(url, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def estimate_open_interest(self, symbol: str) -> float:
         """Estimate open interest using 24h volume as a proxy."""
@@ -312,9 +590,14 @@ class MarketDataFetcher:
             return estimated_oi
 
         except Exception as exc:
-            log.warning(f"Could not estimate open interest for {symbol}: {exc}")
+            log.warning("Could not estimate open interest for {}: {}", symbol, exc)
             return 0.0
 
+    async def aestimate_open_interest(self, symbol: str) -> float:
+        """Async variant of :meth:`estimate_open_interest`."""
+
+        return await asyncio.to_thread(self.estimate_open_interest, symbol)
+
     def estimate_funding_rate(self, symbol: str) -> float:
         """Return a neutral funding rate placeholder for free data sources."""
 
@@ -1,7 +1,15 @@
 """Deribit exchange implementation using ccxt"""
 
+import asyncio
+import copy
+import functools
+import inspect
+import threading
+import time
 import ccxt
-from typing import List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from src.exchanges.base import (
     BaseExchange,
@@ -9,41 +17,273 @@ from src.exchanges.base import (
     OrderBook,
     Position,
     Order,
-    Balance
+    Balance,
+    ohlcv_from_rows,
+    perpetual_symbol
 )
 from src.logger import log
 
 
+# Streamed data older than this (seconds) is ignored in favour of REST
+STREAM_STALENESS = 30.0
+# Pause before re-subscribing after a WebSocket error (seconds)
+STREAM_RETRY_DELAY = 5.0
+# REST tickers are reused for this long (seconds) when the stream is stale
+TICKER_TTL = 0.5
+# Client-side REST request budgets (requests per second) per endpoint group
+MARKET_DATA_RATE = 20.0
+ACCOUNT_RATE = 10.0
+TRADING_RATE = 5.0
+
+
+def _rest_session() -> requests.Session:
+    """HTTP session for the REST client with a pool sized for concurrent calls"""
+    session = requests.Session()
+    # ccxt handles rate limiting and retries itself, so no urllib3 retries
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+class _TokenBucket:
+    """Asyncio token bucket: ``rate`` requests per second, bursts up to ``capacity``"""
+
+    __slots__ = ('rate', 'capacity', '_tokens', '_updated')
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+def _failed(task: asyncio.Task) -> bool:
+    """Whether ``task`` finished without a result"""
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+
+# Sentinel default meaning "log the error and re-raise it"
+_RAISE = object()
+
+
+def _ccxt_call(message: str, default: Any = _RAISE, level: str = "ERROR"):
+    """
+    Log failures of an exchange call in one place
+
+    ``message`` is formatted with the call's bound arguments (only when the
+    call fails). The exception is re-raised unless ``default`` is given, in
+    which case a copy of ``default`` is returned instead.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                log.log(level, "{}: {}", message.format(**bound.arguments), e)
+                if default is _RAISE:
+                    raise
+                return copy.copy(default)
+
+        return wrapper
+
+    return decorator
+
+
 class DeribitExchange(BaseExchange):
     """Deribit exchange implementation"""
 
-    def __init__(self, api_key: str, secret: str, testnet: bool = True):
+    # Market metadata shared by every instance, keyed by testnet flag
+    _shared_markets: Dict[bool, Tuple[dict, dict]] = {}
+    _markets_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        secret: str,
+        testnet: bool = True,
+        streams: bool = False,
+        stream_staleness: float = STREAM_STALENESS,
+    ):
         super().__init__(api_key, secret, testnet)
 
-        # Initialize ccxt Deribit client
-        self.exchange = ccxt.deribit({
+        config = {
             'apiKey': api_key,
             'secret': secret,
-            'enableRateLimit': True,
-        })
+        }
+
+        # REST client for orders, positions and fallbacks. Requests are paced
+        # by the per-endpoint buckets below rather than ccxt's global
+        # throttle, so slow history calls do not delay order placement.
+        self.exchange = ccxt.deribit({**config, 'enableRateLimit': False, 'session': _rest_session()})
+        self._market_limit = _TokenBucket(MARKET_DATA_RATE)
+        self._account_limit = _TokenBucket(ACCOUNT_RATE)
+        self._trading_limit = _TokenBucket(TRADING_RATE)
+        # Optional WebSocket client; market data is served from its pushed
+        # updates. Subscriptions only pay off in a long-running process, so a
+        # one-shot run stays on plain REST calls. newUpdates=False makes
+        # watch_* return the whole buffer, not a diff.
+        self.stream = None
+        if streams:
+            import ccxt.pro as ccxtpro
+
+            self.stream = ccxtpro.deribit({**config, 'enableRateLimit': True, 'newUpdates': False})
+        self.stream_staleness = stream_staleness
+
+        self._streams: Dict[Tuple[Any, ...], asyncio.Task] = {}
+        self._stream_data: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._rest_ohlcv: Dict[Tuple[str, str], list] = {}
+        self._rest_tickers: Dict[str, Tuple[float, asyncio.Task]] = {}
 
         # Set testnet if needed
         if testnet:
             self.exchange.set_sandbox_mode(True)
+            if self.stream is not None:
+                self.stream.set_sandbox_mode(True)
             log.info("Deribit exchange initialized in TESTNET mode")
         else:
             log.info("Deribit exchange initialized in PRODUCTION mode")
 
+        self._preload_markets()
+
+    def _preload_markets(self) -> None:
+        """Load market metadata once per process and share it with both clients"""
+        with DeribitExchange._markets_lock:
+            shared = DeribitExchange._shared_markets.get(self.testnet)
+            if shared is None:
+                try:
+                    self.exchange.load_markets()
+                except Exception as e:
+                    # ccxt loads them lazily on the first call instead
+                    log.warning("Could not preload Deribit markets: {}", e)
+                    return
+                shared = (self.exchange.markets, self.exchange.currencies)
+                DeribitExchange._shared_markets[self.testnet] = shared
+            else:
+                self.exchange.set_markets(*shared)
+        if self.stream is not None:
+            self.stream.set_markets(*shared)
+
+    def _ensure_stream(
+        self,
+        key: Tuple[Any, ...],
+        watch: Callable[..., Awaitable[Any]],
+        *args: Any
+    ) -> None:
+        """Start a background subscription for ``key`` if none is running"""
+        task = self._streams.get(key)
+        if task is None or task.done():
+            self._streams[key] = asyncio.create_task(self._run_stream(key, watch, *args))
+
+    async def _run_stream(
+        self,
+        key: Tuple[Any, ...],
+        watch: Callable[..., Awaitable[Any]],
+        *args: Any
+    ) -> None:
+        """Keep the latest pushed payload for ``key`` in memory"""
+        while True:
+            try:
+                data = await watch(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning("Deribit stream {} {} interrupted: {}", key[0], key[1:], e)
+                self._stream_data.pop(key, None)
+                await asyncio.sleep(STREAM_RETRY_DELAY)
+                continue
+            self._stream_data[key] = (time.monotonic(), data)
+
+    async def _rest(self, bucket: _TokenBucket, call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking REST call in a worker thread once ``bucket`` allows it"""
+        async with bucket:
+            return await asyncio.to_thread(call, *args, **kwargs)
+
+    def _streamed(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        """Return the streamed payload for ``key`` if it is fresh enough"""
+        entry = self._stream_data.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.stream_staleness:
+            return None
+        return entry[1]
+
+    async def _ticker(self, symbol: str) -> dict:
+        """Latest ticker, from the stream when fresh, else via REST"""
+        key = ('ticker', symbol)
+        if self.stream is not None:
+            self._ensure_stream(key, self.stream.watch_ticker, symbol)
+            ticker = self._streamed(key)
+            if ticker is not None:
+                return ticker
+
+        # Open interest and funding both read the ticker; one REST fetch
+        # (in flight or under TICKER_TTL old) serves both.
+        now = time.monotonic()
+        entry = self._rest_tickers.get(symbol)
+        if entry is None or now - entry[0] > TICKER_TTL or _failed(entry[1]):
+            task = asyncio.ensure_future(
+                self._rest(self._market_limit, self.exchange.fetch_ticker, symbol)
+            )
+            entry = self._rest_tickers[symbol] = (now, task)
+        return await asyncio.shield(entry[1])
+
+    def _merge_ohlcv(self, symbol: str, timeframe: str, limit: int) -> Optional[list]:
+        """Splice streamed bars onto the last REST history, if they connect"""
+        streamed = self._streamed(('ohlcv', symbol, timeframe))
+        history = self._rest_ohlcv.get((symbol, timeframe))
+        if not streamed or not history:
+            return None
+
+        first_streamed = streamed[0][0]
+        step_ms = self.stream.parse_timeframe(timeframe) * 1000
+        if history[-1][0] + step_ms < first_streamed:
+            return None  # gap between the REST snapshot and the stream
+
+        bars = [bar for bar in history if bar[0] < first_streamed]
+        bars.extend(streamed)
+        if len(bars) < limit:
+            return None
+        return bars[-limit:]
+
+    async def close(self) -> None:
+        """Stop background subscriptions and close the WebSocket client"""
+        for task in self._streams.values():
+            task.cancel()
+        await asyncio.gather(*self._streams.values(), return_exceptions=True)
+        self._streams.clear()
+        if self.stream is not None:
+            await self.stream.close()
+
     def normalize_symbol(self, symbol: str) -> str:
         """
         Normalize symbol to Deribit format
         Examples: BTC-PERPETUAL, ETH-PERPETUAL
         """
-        if symbol.endswith("-PERPETUAL"):
-            return symbol
         # If just "BTC", "ETH", etc., add -PERPETUAL
-        return f"{symbol}-PERPETUAL"
+        return perpetual_symbol(symbol)
 
+    @_ccxt_call("Error fetching OHLCV for {symbol}")
     async def get_ohlcv(
         self,
         symbol: str,
@@ -58,130 +298,124 @@ class DeribitExchange(BaseExchange):
             timeframe: Candle timeframe (1m, 3m, 5m, 15m, 1h, 4h, etc.)
             limit: Number of candles to fetch
         """
-        try:
-            symbol = self.normalize_symbol(symbol)
-
-            # Fetch OHLCV data
-            ohlcv_data = self.exchange.fetch_ohlcv(
-                symbol=symbol,
-                timeframe=timeframe,
-                limit=limit
+        symbol = self.normalize_symbol(symbol)
+        ohlcv_data = None
+        if self.stream is not None:
+            self._ensure_stream(
+                ('ohlcv', symbol, timeframe), self.stream.watch_ohlcv, symbol, timeframe
             )
+            ohlcv_data = self._merge_ohlcv(symbol, timeframe, limit)
 
-            # Convert to OHLCV objects
-            candles = []
-            for candle in ohlcv_data:
-                timestamp, open_, high, low, close, volume = candle
-                candles.append(OHLCV(
-                    timestamp=datetime.fromtimestamp(timestamp / 1000),
-                    open=open_,
-                    high=high,
-                    low=low,
-                    close=close,
-                    volume=volume
-                ))
+        if ohlcv_data is None:
+            ohlcv_data = await self._rest(
+                self._market_limit,
+                self.exchange.fetch_ohlcv, symbol, timeframe, None, limit
+            )
+            if self.stream is not None:
+                self._rest_ohlcv[(symbol, timeframe)] = ohlcv_data
 
-            log.debug(f"Fetched {len(candles)} candles for {symbol} ({timeframe})")
-            return candles
+        candles = ohlcv_from_rows(ohlcv_data)
 
-        except Exception as e:
-            log.error(f"Error fetching OHLCV for {symbol}: {e}")
-            raise
+        log.debug("Fetched {} candles for {} ({})", len(candles), symbol, timeframe)
+        return candles
 
+    @_ccxt_call("Error fetching open interest for {symbol}", default=0.0)
     async def get_open_interest(self, symbol: str) -> float:
         """Get current open interest for a perpetual future"""
-        try:
-            symbol = self.normalize_symbol(symbol)
-            ticker = self.exchange.fetch_ticker(symbol)
+        symbol = self.normalize_symbol(symbol)
+        ticker = await self._ticker(symbol)
 
-            # Deribit provides open interest in the ticker
-            open_interest = ticker.get('info', {}).get('open_interest', 0)
+        # Deribit provides open interest in the ticker
+        open_interest = ticker.get('info', {}).get('open_interest', 0)
 
-            log.debug(f"Open Interest for {symbol}: {open_interest}")
-            return float(open_interest)
-
-        except Exception as e:
-            log.error(f"Error fetching open interest for {symbol}: {e}")
-            return 0.0
+        log.debug("Open Interest for {}: {}", symbol, open_interest)
+        return float(open_interest)
 
+    @_ccxt_call("Error fetching funding rate for {symbol}", default=0.0)
     async def get_funding_rate(self, symbol: str) -> float:
         """Get current funding rate for a perpetual future"""
-        try:
-            symbol = self.normalize_symbol(symbol)
-            ticker = self.exchange.fetch_ticker(symbol)
-
-            # Deribit provides funding rate in the ticker
-            funding_rate = ticker.get('info', {}).get('funding_8h', 0)
+        symbol = self.normalize_symbol(symbol)
+        ticker = await self._ticker(symbol)
 
-            log.debug(f"Funding Rate for {symbol}: {funding_rate}")
-            return float(funding_rate)
+        # Deribit provides funding rate in the ticker
+        funding_rate = ticker.get('info', {}).get('funding_8h', 0)
 
-        except Exception as e:
-            log.error(f"Error fetching funding rate for {symbol}: {e}")
-            return 0.0
+        log.debug("Funding Rate for {}: {}", symbol, funding_rate)
+        return float(funding_rate)
 
+    @_ccxt_call("Error fetching order book for {symbol}")
     async def get_order_book(self, symbol: str, depth: int = 20) -> OrderBook:
         """Get order book snapshot"""
-        try:
-            symbol = self.normalize_symbol(symbol)
-            order_book = self.exchange.fetch_order_book(symbol, limit=depth)
-
-            return OrderBook(
-                timestamp=datetime.now(),
-                bids=order_book['bids'],
-                asks=order_book['asks']
+        symbol = self.normalize_symbol(symbol)
+        order_book = None
+        if self.stream is not None:
+            key = ('book', symbol)
+            self._ensure_stream(key, self.stream.watch_order_book, symbol)
+            order_book = self._streamed(key)
+
+        if order_book is None or len(order_book['bids']) < depth:
+            order_book = await self._rest(
+                self._market_limit,
+                self.exchange.fetch_order_book, symbol, depth
             )
-
-        except Exception as e:
-            log.error(f"Error fetching order book for {symbol}: {e}")
-            raise
-
+        else:
+            order_book = {
+                'bids': order_book['bids'][:depth],
+                'asks': order_book['asks'][:depth],
+            }
+
+        return OrderBook.from_levels(
+            timestamp=datetime.now(),
+            bids=order_book['bids'],
+            asks=order_book['asks']
+        )
+
+    @_ccxt_call("Error fetching balance")
     async def get_balance(self) -> Balance:
         """Get account balance"""
-        try:
-            balance_data = self.exchange.fetch_balance()
-
-            # Deribit uses USD as the quote currency
-            total = balance_data.get('total', {}).get('USD', 0)
-            free = balance_data.get('free', {}).get('USD', 0)
-            used = balance_data.get('used', {}).get('USD', 0)
-
-            return Balance(
-                total=float(total),
-                available=float(free),
-                in_positions=float(used)
-            )
-
-        except Exception as e:
-            log.error(f"Error fetching balance: {e}")
-            raise
-
+        balance_data = None
+        if self.stream is not None:
+            key = ('balance',)
+            self._ensure_stream(key, self.stream.watch_balance)
+            balance_data = self._streamed(key)
+
+        if balance_data is None:
+            balance_data = await self._rest(self._account_limit, self.exchange.fetch_balance)
+
+        # Deribit uses USD as the quote currency
+        total = balance_data.get('total', {}).get('USD', 0)
+        free = balance_data.get('free', {}).get('USD', 0)
+        used = balance_data.get('used', {}).get('USD', 0)
+
+        return Balance(
+            total=float(total),
+            available=float(free),
+            in_positions=float(used)
+        )
+
+    @_ccxt_call("Error fetching positions", default=[])
     async def get_positions(self) -> List[Position]:
         """Get all open positions"""
-        try:
-            positions_data = self.exchange.fetch_positions()
-            positions = []
-
-            for pos in positions_data:
-                if pos['contracts'] > 0:  # Only include open positions
-                    positions.append(Position(
-                        symbol=pos['symbol'],
-                        side='long' if pos['side'] == 'long' else 'short',
-                        quantity=float(pos['contracts']),
-                        entry_price=float(pos['entryPrice']),
-                        current_price=float(pos['markPrice']),
-                        unrealized_pnl=float(pos['unrealizedPnl']),
-                        liquidation_price=float(pos.get('liquidationPrice', 0)),
-                        leverage=int(pos.get('leverage', 1))
-                    ))
-
-            log.debug(f"Found {len(positions)} open positions")
-            return positions
-
-        except Exception as e:
-            log.error(f"Error fetching positions: {e}")
-            return []
+        positions_data = await self._rest(self._account_limit, self.exchange.fetch_positions)
+        positions = []
+
+        for pos in positions_data:
+            if pos['contracts'] > 0:  # Only include open positions
+                positions.append(Position(
+                    symbol=pos['symbol'],
+                    side='long' if pos['side'] == 'long' else 'short',
+                    quantity=float(pos['contracts']),
+                    entry_price=float(pos['entryPrice']),
+                    current_price=float(pos['markPrice']),
+                    unrealized_pnl=float(pos['unrealizedPnl']),
+                    liquidation_price=float(pos.get('liquidationPrice', 0)),
+                    leverage=int(pos.get('leverage', 1))
+                ))
 
+        log.debug("Found {} open positions", len(positions))
+        return positions
+
+    @_ccxt_call("Error placing market order for {symbol}")
     async def place_market_order(
         self,
         symbol: str,
@@ -189,30 +423,28 @@ class DeribitExchange(BaseExchange):
         quantity: float
     ) -> Order:
         """Place a market order"""
-        try:
-            symbol = self.normalize_symbol(symbol)
-
-            order = self.exchange.create_market_order(
-                symbol=symbol,
-                side=side,
-                amount=quantity
-            )
-
-            log.info(f"Market {side} order placed: {symbol} {quantity} contracts")
-
-            return Order(
-                order_id=order['id'],
-                symbol=symbol,
-                side=side,
-                order_type='market',
-                quantity=quantity,
-                status='filled' if order['status'] == 'closed' else 'pending'
-            )
-
-        except Exception as e:
-            log.error(f"Error placing market order for {symbol}: {e}")
-            raise
-
+        symbol = self.normalize_symbol(symbol)
+
+        order = await self._rest(
+            self._trading_limit,
+            self.exchange.create_market_order,
+            symbol=symbol,
+            side=side,
+            amount=quantity
+        )
+
+        log.info("Market {} order placed: {} {} contracts", side, symbol, quantity)
+
+        return Order(
+            order_id=order['id'],
+            symbol=symbol,
+            side=side,
+            order_type='market',
+            quantity=quantity,
+            status='filled' if order['status'] == 'closed' else 'pending'
+        )
+
+    @_ccxt_call("Error placing limit order for {symbol}")
     async def place_limit_order(
         self,
         symbol: str,
@@ -221,32 +453,30 @@ class DeribitExchange(BaseExchange):
         price: float
     ) -> Order:
         """Place a limit order"""
-        try:
-            symbol = self.normalize_symbol(symbol)
-
-            order = self.exchange.create_limit_order(
-                symbol=symbol,
-                side=side,
-                amount=quantity,
-                price=price
-            )
-
-            log.info(f"Limit {side} order placed: {symbol} {quantity} @ {price}")
-
-            return Order(
-                order_id=order['id'],
-                symbol=symbol,
-                side=side,
-                order_type='limit',
-                quantity=quantity,
-                price=price,
-                status=order['status']
-            )
-
-        except Exception as e:
-            log.error(f"Error placing limit order for {symbol}: {e}")
-            raise
-
+        symbol = self.normalize_symbol(symbol)
+
+        order = await self._rest(
+            self._trading_limit,
+            self.exchange.create_limit_order,
+            symbol=symbol,
+            side=side,
+            amount=quantity,
+            price=price
+        )
+
+        log.info("Limit {} order placed: {} {} @ {}", side, symbol, quantity, price)
+
+        return Order(
+            order_id=order['id'],
+            symbol=symbol,
+            side=side,
+            order_type='limit',
+            quantity=quantity,
+            price=price,
+            status=order['status']
+        )
+
+    @_ccxt_call("Error placing stop loss for {symbol}")
     async def place_stop_loss(
         self,
         symbol: str,
@@ -255,34 +485,32 @@ class DeribitExchange(BaseExchange):
         stop_price: float
     ) -> Order:
         """Place a stop loss order"""
-        try:
-            symbol = self.normalize_symbol(symbol)
-
-            # Deribit uses stopLoss parameter
-            order = self.exchange.create_order(
-                symbol=symbol,
-                type='stop_market',
-                side=side,
-                amount=quantity,
-                params={'stopPrice': stop_price}
-            )
-
-            log.info(f"Stop loss order placed: {symbol} {quantity} @ {stop_price}")
-
-            return Order(
-                order_id=order['id'],
-                symbol=symbol,
-                side=side,
-                order_type='stop_loss',
-                quantity=quantity,
-                price=stop_price,
-                status=order['status']
-            )
-
-        except Exception as e:
-            log.error(f"Error placing stop loss for {symbol}: {e}")
-            raise
-
+        symbol = self.normalize_symbol(symbol)
+
+        # Deribit uses stopLoss parameter
+        order = await self._rest(
+            self._trading_limit,
+            self.exchange.create_order,
+            symbol=symbol,
+            type='stop_market',
+            side=side,
+            amount=quantity,
+            params={'stopPrice': stop_price}
+        )
+
+        log.info("Stop loss order placed: {} {} @ {}", symbol, quantity, stop_price)
+
+        return Order(
+            order_id=order['id'],
+            symbol=symbol,
+            side=side,
+            order_type='stop_loss',
+            quantity=quantity,
+            price=stop_price,
+            status=order['status']
+        )
+
+    @_ccxt_call("Error placing take profit for {symbol}")
     async def place_take_profit(
         self,
         symbol: str,
@@ -291,60 +519,49 @@ class DeribitExchange(BaseExchange):
         price: float
     ) -> Order:
         """Place a take profit order"""
-        try:
-            symbol = self.normalize_symbol(symbol)
-
-            # Deribit uses takeProfit parameter
-            order = self.exchange.create_order(
-                symbol=symbol,
-                type='take_profit_market',
-                side=side,
-                amount=quantity,
-                params={'stopPrice': price}
-            )
-
-            log.info(f"Take profit order placed: {symbol} {quantity} @ {price}")
-
-            return Order(
-                order_id=order['id'],
-                symbol=symbol,
-                side=side,
-                order_type='take_profit',
-                quantity=quantity,
-                price=price,
-                status=order['status']
-            )
-
-        except Exception as e:
-            log.error(f"Error placing take profit for {symbol}: {e}")
-            raise
-
+        symbol = self.normalize_symbol(symbol)
+
+        # Deribit uses takeProfit parameter
+        order = await self._rest(
+            self._trading_limit,
+            self.exchange.create_order,
+            symbol=symbol,
+            type='take_profit_market',
+            side=side,
+            amount=quantity,
+            params={'stopPrice': price}
+        )
+
+        log.info("Take profit order placed: {} {} @ {}", symbol, quantity, price)
+
+        return Order(
+            order_id=order['id'],
+            symbol=symbol,
+            side=side,
+            order_type='take_profit',
+            quantity=quantity,
+            price=price,
+            status=order['status']
+        )
+
+    @_ccxt_call("Error cancelling order {order_id}", default=False)
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an order"""
-        try:
-            self.exchange.cancel_order(order_id)
-            log.info(f"Order cancelled: {order_id}")
-            return True
-
-        except Exception as e:
-            log.error(f"Error cancelling order {order_id}: {e}")
-            return False
+        await self._rest(self._trading_limit, self.exchange.cancel_order, order_id)
+        log.info("Order cancelled: {}", order_id)
+        return True
 
+    @_ccxt_call("Note: Deribit may set leverage differently", default=False, level="WARNING")
     async def set_leverage(self, symbol: str, leverage: int) -> bool:
         """
         Set leverage for a symbol
         Note: Deribit sets leverage at the account level, not per symbol
         """
-        try:
-            symbol = self.normalize_symbol(symbol)
-
-            # Deribit uses a different API for setting leverage
-            # This might need adjustment based on the specific Deribit API
-            self.exchange.set_leverage(leverage, symbol)
+        symbol = self.normalize_symbol(symbol)
 
-            log.info(f"Leverage set to {leverage}x for {symbol}")
-            return True
+        # Deribit uses a different API for setting leverage
+        # This might need adjustment based on the specific Deribit API
+        await self._rest(self._trading_limit, self.exchange.set_leverage, leverage, symbol)
 
-        except Exception as e:
-            log.warning(f"Note: Deribit may set leverage differently: {e}")
-            return False
+        log.info("Leverage set to {}x for {}", leverage, symbol)
+        return True
@@ -1,21 +1,165 @@
 """Mock exchange simulator that mimics Coinbase API for testing"""
 
-import json
-import uuid
-from typing import List, Optional
+import asyncio
+import atexit
+import os
+import time
+from collections import deque
+from functools import lru_cache
+from operator import itemgetter
+from secrets import token_hex
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
+
+import numpy as np
+import orjson
+
 from src.exchanges.base import (
     BaseExchange,
     OHLCV,
     OrderBook,
     Position,
     Order,
-    Balance
+    Balance,
+    ohlcv_from_rows,
+    perpetual_symbol
 )
 from src.exchanges.data_fetcher import MarketDataFetcher
 from src.logger import log
-from src.config import settings
+from src.config import DATA_DIR, get_settings
+
+STATE_FILE = DATA_DIR / "mock_exchange_state.json"
+WAL_FILE = DATA_DIR / "mock_exchange.wal"
+# Append-only archive of every fill; the state only keeps the latest trades
+TRADES_FILE = DATA_DIR / "mock_trades.jsonl"
+TRADE_HISTORY_LIMIT = 1000
+# Number of logged mutations between full state snapshots
+SNAPSHOT_EVERY = 50
+# Log records produced within this window (seconds) share one write
+WAL_FLUSH_DELAY = 0.05
+# Row layout expected by ohlcv_from_rows
+_CANDLE_FIELDS = itemgetter('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+@lru_cache(maxsize=8)
+def _book_levels(depth: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Relative price offsets and (decreasing) sizes of synthetic book levels"""
+    levels = np.arange(1, depth + 1, dtype=np.float64)
+    steps = levels * 0.0001
+    sizes = 100.0 / levels
+    steps.flags.writeable = False
+    sizes.flags.writeable = False
+    return steps, sizes
+
+
+def _apply_wal_record(state: dict, record: dict) -> None:
+    """Apply a single write-ahead log record to a state dict"""
+    op = record['op']
+    if op == 'fill':
+        if record['position'] is None:
+            state['positions'].pop(record['symbol'], None)
+        else:
+            state['positions'][record['symbol']] = record['position']
+        state['balance'] = record['balance']
+        state['trade_history'].append(record['trade'])
+    elif op == 'order':
+        state['orders'][record['order_id']] = record['order']
+    elif op == 'cancel':
+        if record['order_id'] in state['orders']:
+            state['orders'][record['order_id']]['status'] = 'cancelled'
+
+
+def _replay_wal(state: dict, wal_file: Path) -> int:
+    """Replay log records newer than the snapshot; return the last sequence number"""
+    last_seq = state.get('wal_seq', 0)
+    if not wal_file.exists():
+        return last_seq
+
+    for line in wal_file.read_bytes().splitlines():
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # A torn final line from an interrupted write
+            continue
+        if record['seq'] <= last_seq:
+            continue
+        _apply_wal_record(state, record)
+        last_seq = record['seq']
+    return last_seq
+
+
+def read_state(state_file: Path = STATE_FILE, wal_file: Path = WAL_FILE) -> dict:
+    """Read the latest mock exchange state (snapshot plus logged mutations)"""
+    state = orjson.loads(state_file.read_bytes())
+    state['wal_seq'] = _replay_wal(state, wal_file)
+    history = state['trade_history']
+    # Remember when trading began before the oldest fills are trimmed away
+    if 'first_trade_ns' not in state and history:
+        first = history[0]
+        try:
+            state['first_trade_ns'] = first.get('ts_ns') or round(
+                datetime.fromisoformat(first['timestamp']).timestamp() * 1e6
+            ) * 1000
+        except (KeyError, TypeError, ValueError):
+            pass
+    del history[:-TRADE_HISTORY_LIMIT]
+    return state
+
+
+class PositionBook:
+    """Open positions stored as parallel arrays (one slot per symbol)"""
+
+    def __init__(self):
+        self.symbols: List[str] = []
+        self.idx: Dict[str, int] = {}
+        self.qty = np.empty(0, dtype=np.float64)
+        self.entry = np.empty(0, dtype=np.float64)
+        self.lev = np.empty(0, dtype=np.int64)
+        self.side = np.empty(0, dtype=np.int8)  # +1 long, -1 short
+
+    @classmethod
+    def from_state(cls, positions: Dict[str, dict]) -> "PositionBook":
+        """Build a book from the persisted ``symbol -> position`` mapping"""
+        book = cls()
+        book.symbols = list(positions)
+        book.idx = {symbol: i for i, symbol in enumerate(book.symbols)}
+        rows = list(positions.values())
+        book.qty = np.array([pos['quantity'] for pos in rows], dtype=np.float64)
+        book.entry = np.array([pos['entry_price'] for pos in rows], dtype=np.float64)
+        book.lev = np.array([pos['leverage'] for pos in rows], dtype=np.int64)
+        book.side = np.array([1 if pos['side'] == 'long' else -1 for pos in rows], dtype=np.int8)
+        return book
+
+    def upsert(self, symbol: str, side: str, quantity: float, entry_price: float, leverage: int):
+        """Insert a position or update it in place"""
+        direction = 1 if side == 'long' else -1
+        i = self.idx.get(symbol)
+        if i is None:
+            self.idx[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            self.qty = np.append(self.qty, quantity)
+            self.entry = np.append(self.entry, entry_price)
+            self.lev = np.append(self.lev, leverage)
+            self.side = np.append(self.side, np.int8(direction))
+        else:
+            self.qty[i] = quantity
+            self.entry[i] = entry_price
+            self.lev[i] = leverage
+            self.side[i] = direction
+
+    def remove(self, symbol: str):
+        """Drop a closed position, keeping the remaining slots in order"""
+        i = self.idx.pop(symbol, None)
+        if i is None:
+            return
+        del self.symbols[i]
+        self.qty = np.delete(self.qty, i)
+        self.entry = np.delete(self.entry, i)
+        self.lev = np.delete(self.lev, i)
+        self.side = np.delete(self.side, i)
+        for j in range(i, len(self.symbols)):
+            self.idx[self.symbols[j]] = j
 
 
 class MockExchange(BaseExchange):
@@ -27,40 +171,75 @@ class MockExchange(BaseExchange):
     - Same interface as real exchange for seamless production cutover
     """
 
-    def __init__(self, api_key: str = "", secret: str = "", testnet: bool = True):
+    def __init__(
+        self,
+        api_key: str = "",
+        secret: str = "",
+        testnet: bool = True,
+        warm_up: bool = False,
+    ):
         super().__init__(api_key, secret, testnet)
 
-        self.data_fetcher = MarketDataFetcher()
-        self.state_file = Path("data/mock_exchange_state.json")
+        settings = get_settings()
+        self.data_fetcher = MarketDataFetcher(
+            warm_up=warm_up,
+            cache_path=settings.ohlcv_cache_file,
+            disk_ttl=settings.ohlcv_disk_cache_ttl,
+        )
+        self.state_file = STATE_FILE
+        self.wal_file = WAL_FILE
+        self.trades_file = TRADES_FILE
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Load or initialize state
         self.state = self._load_state()
-
-        log.info(f"MockExchange initialized - Balance: ${self.state['balance']['total']:.2f}")
+        if not self.trades_file.exists():
+            # Seed the archive so trimming the in-memory history loses nothing
+            self.trades_file.write_bytes(b"".join(
+                orjson.dumps(trade) + b"\n" for trade in self.state['trade_history']
+            ))
+        self.state['trade_history'] = deque(self.state['trade_history'], maxlen=TRADE_HISTORY_LIMIT)
+        self.book = PositionBook.from_state(self.state['positions'])
+
+        # Mutations are appended to a write-ahead log; the full state is only
+        # rewritten every SNAPSHOT_EVERY mutations and at exit.
+        self._wal_seq = self.state.get('wal_seq', 0)
+        self._unsnapshotted = 0
+        self._wal = open(self.wal_file, 'ab', buffering=0)
+        self._wal_pending: List[bytes] = []
+        self._trades = open(self.trades_file, 'ab', buffering=0)
+        self._trades_pending: List[bytes] = []
+        self._wal_flush: Optional[asyncio.TimerHandle] = None
+        self._wal_flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        atexit.register(self._shutdown)
+
+        log.info("MockExchange initialized - Balance: ${:.2f}", self.state['balance']['total'])
 
     def _load_state(self) -> dict:
         """Load state from disk or initialize"""
         if self.state_file.exists():
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
-                log.info("Loaded existing mock exchange state")
-                return state
+            state = read_state(self.state_file, self.wal_file)
+            log.info("Loaded existing mock exchange state")
+            return state
 
         # Initialize new state
+        initial_balance = get_settings().initial_balance
         initial_state = {
             'balance': {
-                'total': settings.initial_balance,
-                'available': settings.initial_balance,
+                'total': initial_balance,
+                'available': initial_balance,
                 'in_positions': 0.0
             },
             'positions': {},  # symbol -> position data
             'orders': {},     # order_id -> order data
-            'trade_history': []
+            'trade_history': [],
+            'wal_seq': 0
         }
+        # Records in an old log would belong to a previous state
+        self.wal_file.unlink(missing_ok=True)
 
         self._save_state(initial_state)
-        log.info(f"Initialized new mock exchange with ${settings.initial_balance} balance")
+        log.info("Initialized new mock exchange with ${} balance", initial_balance)
         return initial_state
 
     def _save_state(self, state: Optional[dict] = None):
@@ -68,14 +247,83 @@ class MockExchange(BaseExchange):
         if state is None:
             state = self.state
 
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f, indent=2, default=str)
+        # Write then rename so readers never observe a half-written snapshot
+        tmp_file = self.state_file.with_suffix('.tmp')
+        tmp_file.write_bytes(orjson.dumps(state, default=list, option=orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_file, self.state_file)
+
+    def _log_mutation(self, record: dict):
+        """Queue a state change for the write-ahead log"""
+        self._wal_seq += 1
+        record['seq'] = self._wal_seq
+        self._wal_pending.append(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+        if record['op'] == 'fill':
+            self._trades_pending.append(orjson.dumps(record['trade']) + b"\n")
+
+        self._unsnapshotted += 1
+        if self._unsnapshotted >= SNAPSHOT_EVERY:
+            self._snapshot()
+        else:
+            self._schedule_wal_flush()
+
+    def _schedule_wal_flush(self):
+        """Group-commit: records logged in the same tick share one write"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_wal()
+            return
+        if self._wal_flush is not None:
+            if self._wal_flush_loop is loop:
+                return
+            # The pending flush belongs to a loop that is gone
+            self._flush_wal()
+        self._wal_flush = loop.call_later(WAL_FLUSH_DELAY, self._flush_wal)
+        self._wal_flush_loop = loop
+
+    def _flush_wal(self):
+        """Append queued log records in a single write"""
+        if self._wal_flush is not None:
+            self._wal_flush.cancel()
+            self._wal_flush = None
+        if self._wal_pending and not self._wal.closed:
+            self._wal.write(b"".join(self._wal_pending))
+        self._wal_pending.clear()
+        self._flush_trades()
+
+    def _flush_trades(self):
+        """Append queued fills to the trade archive"""
+        if self._trades_pending and not self._trades.closed:
+            self._trades.write(b"".join(self._trades_pending))
+        self._trades_pending.clear()
+
+    def _snapshot(self):
+        """Persist the full state and start a fresh log"""
+        # Queued records are already reflected in the snapshot
+        self._wal_pending.clear()
+        self._flush_trades()
+        self.state['wal_seq'] = self._wal_seq
+        self._save_state()
+        self._wal.truncate(0)
+        self._unsnapshotted = 0
+
+    async def close(self):
+        """Snapshot pending changes and close the log"""
+        self._shutdown()
+
+    def _shutdown(self):
+        """Synchronous close, also run at interpreter exit"""
+        if self._wal.closed:
+            return
+        if self._unsnapshotted:
+            self._snapshot()
+        self._flush_wal()
+        self._wal.close()
+        self._trades.close()
 
     def normalize_symbol(self, symbol: str) -> str:
         """Normalize symbol format"""
-        if not symbol.endswith("-PERPETUAL"):
-            return f"{symbol}-PERPETUAL"
-        return symbol
+        return perpetual_symbol(symbol)
 
     async def get_ohlcv(
         self,
@@ -95,26 +343,14 @@ class MockExchange(BaseExchange):
             minutes = int(timeframe.replace('m', '').replace('h', '')) * (60 if 'h' in timeframe else 1)
 
         # Fetch from CoinGecko
-        ohlcv_data = self.data_fetcher.get_ohlcv(symbol, timeframe_minutes=minutes, limit=limit)
-
-        # Convert to OHLCV objects
-        candles = []
-        for candle in ohlcv_data:
-            candles.append(OHLCV(
-                timestamp=datetime.fromtimestamp(candle['timestamp'] / 1000),
-                open=candle['open'],
-                high=candle['high'],
-                low=candle['low'],
-                close=candle['close'],
-                volume=candle['volume']
-            ))
+        ohlcv_data = await self.data_fetcher.aget_ohlcv(symbol, timeframe_minutes=minutes, limit=limit)
 
-        return candles
+        return ohlcv_from_rows(map(_CANDLE_FIELDS, ohlcv_data))
 
     async def get_open_interest(self, symbol: str) -> float:
         """Get estimated open interest"""
         symbol = self.normalize_symbol(symbol)
-        return self.data_fetcher.estimate_open_interest(symbol)
+        return await self.data_fetcher.aestimate_open_interest(symbol)
 
     async def get_funding_rate(self, symbol: str) -> float:
         """Get estimated funding rate"""
@@ -124,23 +360,16 @@ class MockExchange(BaseExchange):
     async def get_order_book(self, symbol: str, depth: int = 20) -> OrderBook:
         """Simulate order book"""
         symbol = self.normalize_symbol(symbol)
-        current_price = self.data_fetcher.get_current_price(symbol)
+        current_price = await self.data_fetcher.aget_price(symbol)
 
         # Generate synthetic order book
-        bids = []
-        asks = []
-        for i in range(depth):
-            bid_price = current_price * (1 - (i + 1) * 0.0001)
-            ask_price = current_price * (1 + (i + 1) * 0.0001)
-            size = 100.0 / (i + 1)  # Decreasing size
-
-            bids.append((bid_price, size))
-            asks.append((ask_price, size))
-
+        steps, sizes = _book_levels(depth)
         return OrderBook(
             timestamp=datetime.now(),
-            bids=bids,
-            asks=asks
+            bid_px=current_price * (1 - steps),
+            bid_sz=sizes.copy(),
+            ask_px=current_price * (1 + steps),
+            ask_sz=sizes.copy()
         )
 
     async def get_balance(self) -> Balance:
@@ -153,41 +382,39 @@ class MockExchange(BaseExchange):
 
     async def get_positions(self) -> List[Position]:
         """Get all open positions"""
-        positions = []
-
-        for symbol, pos_data in self.state['positions'].items():
-            # Get current price
-            current_price = self.data_fetcher.get_current_price(symbol)
-
-            # Calculate PnL
-            entry_price = pos_data['entry_price']
-            quantity = pos_data['quantity']
-            leverage = pos_data['leverage']
-            side = pos_data['side']
-
-            if side == 'long':
-                pnl = (current_price - entry_price) * quantity * leverage
-            else:  # short
-                pnl = (entry_price - current_price) * quantity * leverage
-
-            # Calculate liquidation price
-            if side == 'long':
-                liq_price = entry_price * (1 - 1 / (leverage * 1.5))
-            else:
-                liq_price = entry_price * (1 + 1 / (leverage * 1.5))
+        book = self.book
+        if not book.symbols:
+            return []
 
-            positions.append(Position(
+        prices = await self.data_fetcher.aget_prices(book.symbols)
+        current_price = np.array([prices[symbol] for symbol in book.symbols], dtype=np.float64)
+
+        # side is +1 for long and -1 for short, so one expression covers both
+        pnl = (current_price - book.entry) * book.side * book.qty * book.lev
+        liq_price = book.entry * (1 - book.side / (book.lev * 1.5))
+
+        persisted = self.state['positions']
+        return [
+            Position(
                 symbol=symbol,
-                side=side,
-                quantity=quantity,
-                entry_price=entry_price,
-                current_price=current_price,
-                unrealized_pnl=pnl,
-                liquidation_price=liq_price,
+                side=persisted[symbol]['side'],
+                quantity=qty,
+                entry_price=entry,
+                current_price=price,
+                unrealized_pnl=unrealized,
+                liquidation_price=liq,
                 leverage=leverage
-            ))
-
-        return positions
+            )
+            for symbol, qty, entry, price, unrealized, liq, leverage in zip(
+                book.symbols,
+                book.qty.tolist(),
+                book.entry.tolist(),
+                current_price.tolist(),
+                pnl.tolist(),
+                liq_price.tolist(),
+                book.lev.tolist()
+            )
+        ]
 
     async def place_market_order(
         self,
@@ -197,10 +424,10 @@ class MockExchange(BaseExchange):
     ) -> Order:
         """Simulate market order execution"""
         symbol = self.normalize_symbol(symbol)
-        order_id = str(uuid.uuid4())
+        order_id = token_hex(16)
 
         # Get current market price
-        current_price = self.data_fetcher.get_current_price(symbol)
+        current_price = await self.data_fetcher.aget_price(symbol)
 
         # Simulate slippage (0.05%)
         fill_price = current_price * (1.0005 if side == 'buy' else 0.9995)
@@ -219,20 +446,30 @@ class MockExchange(BaseExchange):
         # Update position
         await self._update_position(symbol, side, quantity, fill_price)
 
-        # Log trade
-        self.state['trade_history'].append({
-            'timestamp': datetime.now().isoformat(),
+        # Log trade; ts_ns lets readers order trades without parsing
+        ts_ns = time.time_ns()
+        trade = {
+            'timestamp': datetime.fromtimestamp(ts_ns / 1e9).isoformat(),
+            'ts_ns': ts_ns,
             'order_id': order_id,
             'symbol': symbol,
             'side': side,
             'quantity': quantity,
             'price': fill_price,
             'type': 'market'
-        })
+        }
+        self.state['trade_history'].append(trade)
+        self.state.setdefault('first_trade_ns', ts_ns)
 
-        self._save_state()
+        self._log_mutation({
+            'op': 'fill',
+            'symbol': symbol,
+            'position': self.state['positions'].get(symbol),
+            'balance': self.state['balance'],
+            'trade': trade
+        })
 
-        log.info(f"[MOCK] Market {side} filled: {symbol} {quantity} @ ${fill_price:.2f}")
+        log.info("[MOCK] Market {} filled: {} {} @ ${:.2f}", side, symbol, quantity, fill_price)
 
         return order
 
@@ -245,7 +482,7 @@ class MockExchange(BaseExchange):
     ) -> Order:
         """Simulate limit order (simplified - marks as pending)"""
         symbol = self.normalize_symbol(symbol)
-        order_id = str(uuid.uuid4())
+        order_id = token_hex(16)
 
         order = Order(
             order_id=order_id,
@@ -266,9 +503,9 @@ class MockExchange(BaseExchange):
             'status': 'pending'
         }
 
-        self._save_state()
+        self._log_mutation({'op': 'order', 'order_id': order_id, 'order': self.state['orders'][order_id]})
 
-        log.info(f"[MOCK] Limit {side} placed: {symbol} {quantity} @ ${price:.2f}")
+        log.info("[MOCK] Limit {} placed: {} {} @ ${:.2f}", side, symbol, quantity, price)
 
         return order
 
@@ -281,7 +518,7 @@ class MockExchange(BaseExchange):
     ) -> Order:
         """Simulate stop loss order"""
         symbol = self.normalize_symbol(symbol)
-        order_id = str(uuid.uuid4())
+        order_id = token_hex(16)
 
         order = Order(
             order_id=order_id,
@@ -302,9 +539,9 @@ class MockExchange(BaseExchange):
             'status': 'pending'
         }
 
-        self._save_state()
+        self._log_mutation({'op': 'order', 'order_id': order_id, 'order': self.state['orders'][order_id]})
 
-        log.info(f"[MOCK] Stop loss placed: {symbol} {quantity} @ ${stop_price:.2f}")
+        log.info("[MOCK] Stop loss placed: {} {} @ ${:.2f}", symbol, quantity, stop_price)
 
         return order
 
@@ -317,7 +554,7 @@ class MockExchange(BaseExchange):
     ) -> Order:
         """Simulate take profit order"""
         symbol = self.normalize_symbol(symbol)
-        order_id = str(uuid.uuid4())
+        order_id = token_hex(16)
 
         order = Order(
             order_id=order_id,
@@ -338,9 +575,9 @@ class MockExchange(BaseExchange):
             'status': 'pending'
         }
 
-        self._save_state()
+        self._log_mutation({'op': 'order', 'order_id': order_id, 'order': self.state['orders'][order_id]})
 
-        log.info(f"[MOCK] Take profit placed: {symbol} {quantity} @ ${price:.2f}")
+        log.info("[MOCK] Take profit placed: {} {} @ ${:.2f}", symbol, quantity, price)
 
         return order
 
@@ -348,15 +585,16 @@ class MockExchange(BaseExchange):
         """Cancel an order"""
         if order_id in self.state['orders']:
             self.state['orders'][order_id]['status'] = 'cancelled'
-            self._save_state()
-            log.info(f"[MOCK] Order cancelled: {order_id}")
+            self._log_mutation({'op': 'cancel', 'order_id': order_id})
+            self._flush_wal()
+            log.info("[MOCK] Order cancelled: {}", order_id)
             return True
         return False
 
     async def set_leverage(self, symbol: str, leverage: int) -> bool:
         """Set leverage for a symbol"""
         symbol = self.normalize_symbol(symbol)
-        log.info(f"[MOCK] Leverage set to {leverage}x for {symbol}")
+        log.info("[MOCK] Leverage set to {}x for {}", leverage, symbol)
         return True
 
     async def _update_position(self, symbol: str, side: str, quantity: float, price: float):
@@ -393,22 +631,28 @@ class MockExchange(BaseExchange):
                 'side': 'long' if side == 'buy' else 'short',
                 'quantity': quantity,
                 'entry_price': price,
-                'leverage': settings.default_leverage,
+                'leverage': get_settings().default_leverage,
                 'opened_at': datetime.now().isoformat()
             }
 
         # Update balance
+        self._sync_book(symbol)
         self._update_balance()
 
+    def _sync_book(self, symbol: str):
+        """Mirror one symbol's persisted position into the position book"""
+        pos = self.state['positions'].get(symbol)
+        if pos is None:
+            self.book.remove(symbol)
+        else:
+            self.book.upsert(symbol, pos['side'], pos['quantity'], pos['entry_price'], pos['leverage'])
+
     def _update_balance(self):
         """Recalculate available balance based on positions"""
-        total_in_positions = 0.0
+        book = self.book
 
-        for symbol, pos in self.state['positions'].items():
-            # Margin used = position value / leverage
-            position_value = pos['quantity'] * pos['entry_price']
-            margin_used = position_value / pos['leverage']
-            total_in_positions += margin_used
+        # Margin used = position value / leverage
+        total_in_positions = float((book.qty * book.entry / book.lev).sum())
 
         self.state['balance']['in_positions'] = total_in_positions
         self.state['balance']['available'] = self.state['balance']['total'] - total_in_positions
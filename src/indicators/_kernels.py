@@ -0,0 +1,143 @@
+"""Single-pass indicator kernels, JIT-compiled with numba when it is installed."""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, types
+except ImportError:  # pragma: no cover - numba is optional
+    types = None
+
+    def njit(*args, **kwargs):
+        """Fallback that leaves the kernel as plain Python/NumPy code."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def _signatures() -> list:
+    """Eager signature accepting the read-only arrays pandas 3 ``to_numpy`` returns."""
+
+    if types is None:  # pragma: no cover - numba is optional
+        return []
+    # Writable arrays convert to the read-only type, so one signature
+    # accepts both without an ambiguous overload.
+    array = types.Array(types.float64, 1, "A", readonly=True)
+    result = types.UniTuple(types.float64[:], 7)
+    return [result(array, array, array, *(types.int64,) * 5)]
+
+
+# Eager signatures: compiled (or loaded from cache) at import time rather
+# than on the first call from the trading loop.
+_COMPUTE_ALL_SIGNATURES = _signatures()
+
+
+@njit(_COMPUTE_ALL_SIGNATURES, cache=True)
+def compute_all(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    fast: int,
+    slow: int,
+    signal: int,
+    rsi_length: int,
+    atr_length: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute EMA fast/slow, MACD line/signal/histogram, RSI and ATR in one pass.
+
+    Matches pandas-ta's defaults: EMAs (and the MACD signal) are seeded with
+    the SMA of their first ``length`` values, while RSI and ATR use Wilder's
+    RMA (``ewm(alpha=1/length, min_periods=length)``). Values before an
+    indicator has enough data are NaN.
+    """
+
+    n = close.shape[0]
+    ema_fast = np.full(n, np.nan)
+    ema_slow = np.full(n, np.nan)
+    macd = np.full(n, np.nan)
+    macd_signal = np.full(n, np.nan)
+    macd_hist = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    atr = np.full(n, np.nan)
+
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_signal = 2.0 / (signal + 1)
+    decay_rsi = 1.0 - 1.0 / rsi_length
+    decay_atr = 1.0 - 1.0 / atr_length
+
+    fast_state = slow_state = signal_state = 0.0
+    macd_count = 0
+    gain_num = loss_num = rsi_den = 0.0
+    tr_num = atr_den = 0.0
+
+    for i in range(n):
+        price = close[i]
+
+        # EMAs seeded with the SMA of their first ``length`` closes
+        if i < fast:
+            fast_state += price
+            if i == fast - 1:
+                fast_state /= fast
+        else:
+            fast_state += alpha_fast * (price - fast_state)
+        if i < slow:
+            slow_state += price
+            if i == slow - 1:
+                slow_state /= slow
+        else:
+            slow_state += alpha_slow * (price - slow_state)
+        if i >= fast - 1:
+            ema_fast[i] = fast_state
+        if i >= slow - 1:
+            ema_slow[i] = slow_state
+
+        if i >= fast - 1 and i >= slow - 1:
+            line = fast_state - slow_state
+            macd[i] = line
+            # Signal is an SMA-seeded EMA over the valid MACD values only
+            if macd_count < signal:
+                signal_state += line
+                if macd_count == signal - 1:
+                    signal_state /= signal
+            else:
+                signal_state += alpha_signal * (line - signal_state)
+            macd_count += 1
+            if macd_count >= signal:
+                macd_signal[i] = signal_state
+                macd_hist[i] = line - signal_state
+
+        if i == 0:
+            continue
+
+        # Wilder smoothing as a running weighted mean (ewm with adjust=True)
+        previous = close[i - 1]
+        change = price - previous
+        gain_num = max(change, 0.0) + decay_rsi * gain_num
+        loss_num = max(-change, 0.0) + decay_rsi * loss_num
+        rsi_den = 1.0 + decay_rsi * rsi_den
+        if i >= rsi_length:
+            avg_gain = gain_num / rsi_den
+            avg_loss = loss_num / rsi_den
+            total = avg_gain + avg_loss
+            if total > 0.0:
+                rsi[i] = 100.0 * avg_gain / total
+
+        # Two selects rather than a 3-way max call, so the JIT can emit
+        # maxsd/cmov instructions instead of branches.
+        high_low = high[i] - low[i]
+        high_close = abs(high[i] - previous)
+        low_close = abs(previous - low[i])
+        true_range = high_low if high_low > high_close else high_close
+        true_range = true_range if true_range > low_close else low_close
+        tr_num = true_range + decay_atr * tr_num
+        atr_den = 1.0 + decay_atr * atr_den
+        if i >= atr_length:
+            atr[i] = tr_num / atr_den
+
+    return ema_fast, ema_slow, macd, macd_signal, macd_hist, rsi, atr
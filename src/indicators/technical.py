@@ -1,20 +1,41 @@
-"""Technical indicator calculations using pandas-ta."""
+"""Technical indicator calculations built on a fused single-pass kernel."""
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Mapping, MutableMapping, Optional, Sequence, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
 from src.exchanges.base import OHLCV
 from src.exchanges.data_fetcher import MarketDataFetcher
+from src.indicators._kernels import compute_all
 from src.logger import log
 
 CandleInput = Union[OHLCV, Mapping[str, Union[int, float, datetime]]]
 
+_OHLCV_FIELDS = attrgetter("timestamp", "open", "high", "low", "close", "volume")
+
+
+@lru_cache(maxsize=None)
+def _epoch_dtype(unit: str) -> np.dtype:
+    """Resolution ``pd.to_datetime(..., unit=unit)`` gives (ns before pandas 3)."""
+
+    return pd.to_datetime(np.zeros(1, dtype=np.int64), unit=unit).dtype
+
+
+def _candle_fields(candle: CandleInput) -> Tuple:
+    """Return a candle's ``(timestamp, open, high, low, close, volume)`` values."""
+
+    if isinstance(candle, OHLCV):
+        return _OHLCV_FIELDS(candle)
+    return tuple(candle.get(key) for key in ("timestamp", "open", "high", "low", "close", "volume"))
+
 
 @dataclass(frozen=True)
 class IndicatorConfig:
@@ -79,6 +100,16 @@ class TechnicalIndicatorCalculator:
     ) -> None:
         self.data_fetcher = data_fetcher or MarketDataFetcher()
         self.config = config or IndicatorConfig()
+        # The config is frozen, so the kernel's window lengths are read once
+        self._kernel_lengths = (
+            self.config.ema_fast,
+            self.config.ema_slow,
+            self.config.macd_signal,
+            self.config.rsi_length,
+            self.config.atr_length,
+        )
+        # (symbol, timeframe) -> (fingerprint of the candles, snapshot)
+        self._snapshot_cache: Dict[Tuple[str, str], Tuple[Tuple, IndicatorSnapshot]] = {}
 
     def calculate_for_symbol(
         self,
@@ -111,7 +142,16 @@ class TechnicalIndicatorCalculator:
                 timeframe_minutes=minutes,
                 limit=limit,
             )
+            # Until the newest candle changes (a new bar, or the forming bar
+            # ticking) the indicators are the same as on the previous call.
+            fingerprint = (len(ohlcv), _candle_fields(ohlcv[-1])) if ohlcv else None
+            cached = self._snapshot_cache.get((symbol, timeframe))
+            if cached is not None and cached[0] == fingerprint:
+                results[timeframe] = cached[1]
+                continue
+
             snapshot = self.calculate_from_candles(ohlcv, timeframe=timeframe)
+            self._snapshot_cache[(symbol, timeframe)] = (fingerprint, snapshot)
             results[timeframe] = snapshot
 
         return results
@@ -128,43 +168,41 @@ class TechnicalIndicatorCalculator:
             raise ValueError("At least one candle is required to calculate indicators")
 
         df = self._candles_to_dataframe(candles)
-        indicator_df = self._build_indicator_frame(df)
-        if indicator_df.empty:
-            raise ValueError("Indicator calculation resulted in an empty dataset")
-
-        latest = indicator_df.iloc[-1]
-        timestamp = latest.name
+        timestamp, close, ema_fast, ema_slow, macd, macd_signal, macd_hist, rsi, atr = (
+            self._compute_latest(df)
+        )
         if hasattr(timestamp, "to_pydatetime"):
             timestamp = timestamp.to_pydatetime()
         if getattr(timestamp, "tzinfo", None) is not None:
             timestamp = timestamp.replace(tzinfo=None)
 
-        ema_trend = "bullish" if latest["ema_fast"] > latest["ema_slow"] else "bearish"
-        if abs(latest["ema_fast"] - latest["ema_slow"]) <= 1e-9:
+        ema_trend = "bullish" if ema_fast > ema_slow else "bearish"
+        if abs(ema_fast - ema_slow) <= 1e-9:
             ema_trend = "neutral"
 
         snapshot = IndicatorSnapshot(
             timeframe=timeframe,
             as_of=timestamp,
-            close=float(latest["close"]),
-            ema_fast=float(latest["ema_fast"]),
-            ema_slow=float(latest["ema_slow"]),
+            close=close,
+            ema_fast=ema_fast,
+            ema_slow=ema_slow,
             ema_trend=ema_trend,
-            macd=float(latest["macd"]),
-            macd_signal=float(latest["macd_signal"]),
-            macd_hist=float(latest["macd_hist"]),
-            rsi=float(latest["rsi"]),
-            atr=float(latest["atr"]),
+            macd=macd,
+            macd_signal=macd_signal,
+            macd_hist=macd_hist,
+            rsi=rsi,
+            atr=atr,
         )
 
-        log.debug(
+        # Lazy, so the snapshot fields are only read when DEBUG is enabled
+        log.opt(lazy=True).debug(
             "Indicator snapshot",
-            timeframe=timeframe,
-            close=snapshot.close,
-            ema_fast=snapshot.ema_fast,
-            ema_slow=snapshot.ema_slow,
-            macd=snapshot.macd,
-            rsi=snapshot.rsi,
+            timeframe=lambda: timeframe,
+            close=lambda: snapshot.close,
+            ema_fast=lambda: snapshot.ema_fast,
+            ema_slow=lambda: snapshot.ema_slow,
+            macd=lambda: snapshot.macd,
+            rsi=lambda: snapshot.rsi,
         )
 
         return snapshot
@@ -173,94 +211,97 @@ class TechnicalIndicatorCalculator:
     def _candles_to_dataframe(candles: Sequence[CandleInput]) -> pd.DataFrame:
         """Convert various candle representations to a clean DataFrame."""
 
-        records: List[MutableMapping[str, float]] = []
-        for candle in candles:
-            if isinstance(candle, OHLCV):
-                timestamp = candle.timestamp
-                record = {
-                    "timestamp": timestamp,
-                    "open": candle.open,
-                    "high": candle.high,
-                    "low": candle.low,
-                    "close": candle.close,
-                    "volume": candle.volume,
-                }
-            else:
-                timestamp = candle.get("timestamp")
-                record = {
-                    "timestamp": timestamp,
-                    "open": float(candle.get("open", 0.0)),
-                    "high": float(candle.get("high", 0.0)),
-                    "low": float(candle.get("low", 0.0)),
-                    "close": float(candle.get("close", 0.0)),
-                    "volume": float(candle.get("volume", 0.0)),
-                }
-            records.append(record)
-
-        df = pd.DataFrame.from_records(records)
-        if "timestamp" not in df.columns:
-            raise ValueError("Candles must include a timestamp field")
-
-        timestamps = df["timestamp"]
-        if pd.api.types.is_numeric_dtype(timestamps):
-            first_value = float(timestamps.iloc[0])
-            unit = "ms" if abs(first_value) >= 1e12 else "s"
-            parsed = pd.to_datetime(timestamps, unit=unit, utc=True)
+        if all(type(candle) is OHLCV for candle in candles):
+            rows = list(map(_OHLCV_FIELDS, candles))
         else:
-            parsed = pd.to_datetime(timestamps, utc=True, errors="coerce")
-
-        if parsed.isna().any():
-            raise ValueError("Unable to parse candle timestamps")
-
-        parsed_index = pd.DatetimeIndex(parsed)
-        if parsed_index.tz is not None:
-            parsed_index = parsed_index.tz_localize(None)
-
-        df.index = parsed_index
-        df = df.drop(columns=["timestamp"])
-        df = df.sort_index()
-        df = df.astype({"open": float, "high": float, "low": float, "close": float, "volume": float})
+            rows = [
+                _OHLCV_FIELDS(candle)
+                if isinstance(candle, OHLCV)
+                else (
+                    candle.get("timestamp"),
+                    float(candle.get("open", 0.0)),
+                    float(candle.get("high", 0.0)),
+                    float(candle.get("low", 0.0)),
+                    float(candle.get("close", 0.0)),
+                    float(candle.get("volume", 0.0)),
+                )
+                for candle in candles
+            ]
+
+        # Transpose once into a timestamp column and a (5, N) value block
+        timestamps, *columns = zip(*rows)
+        values = np.array(columns, dtype=np.float64)
+
+        timestamps = pd.Index(timestamps)
+        epoch = None
+        if pd.api.types.is_integer_dtype(timestamps):
+            epoch = timestamps.to_numpy(dtype=np.int64)
+        elif pd.api.types.is_float_dtype(timestamps):
+            # The CoinGecko fetcher emits whole milliseconds as floats
+            values_f = timestamps.to_numpy()
+            if np.isfinite(values_f).all():
+                whole = values_f.astype(np.int64)
+                if np.array_equal(whole, values_f):
+                    epoch = whole
+
+        if epoch is not None:
+            # Epoch integers map straight onto naive datetime64 values, at
+            # the resolution pd.to_datetime would have produced.
+            unit = "ms" if abs(int(epoch[0])) >= 10**12 else "s"
+            parsed_index = pd.DatetimeIndex(
+                epoch.view(f"datetime64[{unit}]").astype(_epoch_dtype(unit), copy=False)
+            )
+        else:
+            if pd.api.types.is_numeric_dtype(timestamps):
+                first_value = float(timestamps[0])
+                unit = "ms" if abs(first_value) >= 1e12 else "s"
+                parsed = pd.to_datetime(timestamps, unit=unit, utc=True)
+            else:
+                parsed = pd.to_datetime(timestamps, utc=True, errors="coerce")
+
+            if parsed.isna().any():
+                raise ValueError("Unable to parse candle timestamps")
+
+            parsed_index = pd.DatetimeIndex(parsed)
+            if parsed_index.tz is not None:
+                parsed_index = parsed_index.tz_localize(None)
+
+        df = pd.DataFrame(
+            {
+                "open": values[0],
+                "high": values[1],
+                "low": values[2],
+                "close": values[3],
+                "volume": values[4],
+            },
+            index=parsed_index,
+        )
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
         return df
 
-    def _build_indicator_frame(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add indicator columns to the OHLCV frame and drop incomplete rows."""
-
-        close_series = df["close"]
-        ema_fast = ta.ema(close_series, length=self.config.ema_fast)
-        ema_slow = ta.ema(close_series, length=self.config.ema_slow)
-        macd_df = ta.macd(
-            close_series,
-            fast=self.config.ema_fast,
-            slow=self.config.ema_slow,
-            signal=self.config.macd_signal,
-        )
-        if macd_df is None or macd_df.empty:
-            raise ValueError("Unable to compute MACD values with the provided candles")
-
-        macd_columns = list(macd_df.columns)
-        if len(macd_columns) < 3:
-            raise ValueError("Unexpected MACD output format")
-        rsi = ta.rsi(close_series, length=self.config.rsi_length)
-        atr = ta.atr(
-            high=df["high"],
-            low=df["low"],
-            close=close_series,
-            length=self.config.atr_length,
+    def _compute_latest(
+        self, df: pd.DataFrame
+    ) -> Tuple[pd.Timestamp, float, float, float, float, float, float, float, float]:
+        """Return the timestamp, close and indicator values of the newest complete row."""
+
+        close = df["close"].to_numpy(dtype=np.float64)
+        columns = (close,) + compute_all(
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            close,
+            *self._kernel_lengths,
         )
 
-        frames = [
-            close_series.rename("close"),
-            ema_fast.rename("ema_fast"),
-            ema_slow.rename("ema_slow"),
-            macd_df.rename(columns={
-                macd_columns[0]: "macd",
-                macd_columns[1]: "macd_signal",
-                macd_columns[2]: "macd_hist",
-            }),
-            rsi.rename("rsi"),
-            atr.rename("atr"),
-        ]
-
-        indicator_df = pd.concat(frames, axis=1)
-        indicator_df = indicator_df.dropna()
-        return indicator_df
+        row = len(close) - 1
+        values = [float(column[row]) for column in columns]
+        if any(math.isnan(value) for value in values):
+            # Too few candles, or a value undefined on the newest row (e.g.
+            # RSI over a perfectly flat window): use the newest complete row.
+            complete = np.flatnonzero(~np.isnan(np.vstack(columns)).any(axis=0))
+            if not complete.size:
+                raise ValueError("Indicator calculation resulted in an empty dataset")
+            row = int(complete[-1])
+            values = [float(column[row]) for column in columns]
+
+        return (df.index[row], *values)
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final, Optional, TextIO
 
-from loguru import Logger, logger
+from loguru import logger
 
-from src.config import settings
+if TYPE_CHECKING:
+    from loguru import Logger, Message
+
+from src.config import get_settings
 
 __all__ = ["log", "setup_logger"]
 
@@ -32,6 +35,29 @@ SUPPORTED_LOG_LEVELS: Final[frozenset[str]] = frozenset({
     "CRITICAL",
 })
 DEFAULT_LOG_LEVEL: Final[str] = "INFO"
+LOG_FILE_MAX_BYTES: Final[int] = 100 * 1024 * 1024
+
+
+class _SizeRotation:
+    """Rotate once the log file passes ``limit`` characters.
+
+    Loguru's built-in size rotation seeks to the end of the file for every
+    record; this keeps a running count and only asks the file once per file.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._file: Optional[TextIO] = None
+        self._size = 0
+
+    def __call__(self, message: "Message", file: TextIO) -> bool:
+        if file is not self._file:
+            # First record, or the first one after a rotation
+            self._file = file
+            file.seek(0, 2)
+            self._size = file.tell()
+        self._size += len(message)
+        return self._size > self.limit
 
 
 def _resolve_log_level(level: str) -> str:
@@ -48,18 +74,22 @@ def setup_logger() -> Logger:
     # Remove default logger configuration to avoid duplicate handlers
     logger.remove()
 
+    settings = get_settings()
+
     # Ensure the log directory exists
     log_file = Path(settings.log_file)
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
     log_level = _resolve_log_level(settings.log_level)
 
-    # Console output with color
+    # Console output with color. Both sinks are enqueued so formatting and
+    # I/O happen on loguru's worker thread, off the trading loop.
     logger.add(
         sys.stdout,
         format=CONSOLE_FORMAT,
         level=log_level,
         colorize=True,
+        enqueue=True,
     )
 
     # File output with rotation and compression
@@ -67,9 +97,10 @@ def setup_logger() -> Logger:
         log_file,
         format=FILE_FORMAT,
         level=log_level,
-        rotation="100 MB",
+        rotation=_SizeRotation(LOG_FILE_MAX_BYTES),
         retention="30 days",
         compression="zip",
+        enqueue=True,
     )
 
     logger.info(
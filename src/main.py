@@ -7,8 +7,8 @@ from typing import Any, Dict, List
 
 from src.ai import get_ai_model
 from src.ai.prompt_builder import PromptBuilder
-from src.ai.response_parser import parse_ai_response
-from src.config import settings
+from src.ai.response_parser import parse_ai_decisions
+from src.config import get_settings
 from src.analytics.indicators import TechnicalIndicators
 from src.exchanges import get_exchange
 from src.exchanges.base import Balance, Position
@@ -16,6 +16,8 @@ from src.logger import log
 from src.portfolio.tracker import PortfolioTracker
 from src.trading.risk_manager import RiskManager
 
+_TRADE_ACTIONS = frozenset({"BUY", "SELL"})
+
 
 class TradingBot:
     """Main trading bot orchestrator."""
@@ -36,7 +38,7 @@ class TradingBot:
 
         self.invocation_count += 1
         self.prompt_builder.invocation_count = self.invocation_count
-        log.info("=== Iteration #%s ===", self.invocation_count)
+        log.info("=== Iteration #{} ===", self.invocation_count)
 
         try:
             market_data = await self._fetch_market_data()
@@ -50,19 +52,25 @@ class TradingBot:
             )
 
             raw_response = await self.ai_model.get_trading_decision(system_prompt)
-            decision = parse_ai_response(raw_response)
+            decisions = parse_ai_decisions(raw_response)
+
+            traded = False
+            for decision in decisions:
+                log.info(
+                    "AI Decision: {} {} (confidence {:.2f})",
+                    decision.get("action"),
+                    decision.get("symbol"),
+                    decision.get("confidence", 0.0),
+                )
 
-            log.info(
-                "AI Decision: %s %s (confidence %.2f)",
-                decision.get("action"),
-                decision.get("symbol"),
-                decision.get("confidence", 0.0),
-            )
+                if decision.get("action") != "HOLD":
+                    await self._execute_trade(decision, balance)
+                    # Size the next trade against the post-trade balance
+                    balance = await self.exchange.get_balance()
+                    traded = True
 
-            if decision.get("action") != "HOLD":
-                await self._execute_trade(decision, balance)
-                # Refresh balance/positions after potential trade execution
-                balance = await self.exchange.get_balance()
+            if traded:
+                # Refresh positions after potential trade execution
                 positions = await self.exchange.get_positions()
                 sharpe_ratio = await self.portfolio_tracker.get_sharpe_ratio()
                 portfolio_state = self._build_portfolio_state(
@@ -75,27 +83,49 @@ class TradingBot:
             await self._log_performance(balance, positions)
 
         except Exception as exc:  # pragma: no cover - defensive logging
-            log.error("Error in trading iteration: %s", exc, exc_info=True)
+            log.exception("Error in trading iteration: {}", exc)
 
     async def _fetch_market_data(self) -> Dict[str, Any]:
         """Fetch OHLCV, open interest and funding rate for all symbols."""
 
+        # Every request for every symbol is issued at once, so the fetch takes
+        # about one round-trip rather than four per symbol.
+        symbols = get_settings().symbol_list
+        results = await asyncio.gather(
+            *(
+                request
+                for symbol in symbols
+                for request in (
+                    self.exchange.get_ohlcv(symbol, "3m", 120),
+                    self.exchange.get_ohlcv(symbol, "4h", 120),
+                    self.exchange.get_open_interest(symbol),
+                    self.exchange.get_funding_rate(symbol),
+                )
+            ),
+            return_exceptions=True,
+        )
+
         market_data: Dict[str, Any] = {}
-        for symbol in settings.symbol_list:
-            try:
-                candles_3m = await self.exchange.get_ohlcv(symbol, "3m", 120)
-                candles_4h = await self.exchange.get_ohlcv(symbol, "4h", 120)
-                open_interest = await self.exchange.get_open_interest(symbol)
-                funding_rate = await self.exchange.get_funding_rate(symbol)
-
-                market_data[symbol] = {
-                    "candles_3m": candles_3m,
-                    "candles_4h": candles_4h,
-                    "open_interest": open_interest,
-                    "funding_rate": funding_rate,
-                }
-            except Exception as exc:
-                log.error("Failed to fetch market data for %s: %s", symbol, exc, exc_info=True)
+        for index, symbol in enumerate(symbols):
+            candles_3m, candles_4h, open_interest, funding_rate = results[4 * index : 4 * index + 4]
+            exc = next(
+                (
+                    result
+                    for result in (candles_3m, candles_4h, open_interest, funding_rate)
+                    if isinstance(result, BaseException)
+                ),
+                None,
+            )
+            if exc is not None:
+                log.opt(exception=exc).error("Failed to fetch market data for {}: {}", symbol, exc)
+                continue
+
+            market_data[symbol] = {
+                "candles_3m": candles_3m,
+                "candles_4h": candles_4h,
+                "open_interest": open_interest,
+                "funding_rate": funding_rate,
+            }
 
         if not market_data:
             raise RuntimeError("No market data available for any symbol")
@@ -115,7 +145,7 @@ class TradingBot:
                 calculated["funding_rate"] = data.get("funding_rate")
                 results[symbol] = calculated
             except Exception as exc:
-                log.error("Failed to calculate indicators for %s: %s", symbol, exc, exc_info=True)
+                log.exception("Failed to calculate indicators for {}: {}", symbol, exc)
 
         return results
 
@@ -132,11 +162,10 @@ class TradingBot:
         positions: List[Position],
         sharpe_ratio: float,
     ) -> Dict[str, Any]:
+        initial_balance = get_settings().initial_balance
         total_return_pct = 0.0
-        if settings.initial_balance > 0:
-            total_return_pct = (
-                (balance.total - settings.initial_balance) / settings.initial_balance * 100
-            )
+        if initial_balance > 0:
+            total_return_pct = (balance.total - initial_balance) / initial_balance * 100
 
         return {
             "available_cash": balance.available,
@@ -147,6 +176,7 @@ class TradingBot:
         }
 
     async def _execute_trade(self, decision: Dict[str, Any], balance: Balance) -> None:
+        settings = get_settings()
         if not settings.enable_trading:
             log.warning("Trading disabled in configuration, skipping execution")
             return
@@ -157,20 +187,20 @@ class TradingBot:
         symbol = decision.get("symbol")
         action = decision.get("action", "HOLD").upper()
 
-        if action not in {"BUY", "SELL"}:
-            log.warning("Unsupported trade action: %s", action)
+        if action not in _TRADE_ACTIONS:
+            log.warning("Unsupported trade action: {}", action)
             return
         position_size_pct = decision.get("position_size_pct") or settings.position_size_pct
 
         try:
             candles = await self.exchange.get_ohlcv(symbol, "3m", 1)
             if not candles:
-                log.warning("No recent candles available for %s", symbol)
+                log.warning("No recent candles available for {}", symbol)
                 return
 
             current_price = candles[-1].close
             if current_price <= 0:
-                log.warning("Invalid current price for %s", symbol)
+                log.warning("Invalid current price for {}", symbol)
                 return
 
             available_cash = balance.available
@@ -178,45 +208,41 @@ class TradingBot:
             quantity = position_value / current_price
 
             if quantity <= 0:
-                log.warning("Calculated quantity %.4f for %s is not tradeable", quantity, symbol)
+                log.warning("Calculated quantity {:.4f} for {} is not tradeable", quantity, symbol)
                 return
 
             side = "buy" if action == "BUY" else "sell"
             order = await self.exchange.place_market_order(symbol, side, quantity)
-            log.info("Trade executed: %s", order)
+            log.info("Trade executed: {}", order)
 
             stop_loss = decision.get("stop_loss")
             take_profit = decision.get("take_profit")
+            exit_side = "sell" if action == "BUY" else "buy"
 
+            protective_orders = []
             if stop_loss:
-                await self.exchange.place_stop_loss(
-                    symbol,
-                    "sell" if action == "BUY" else "buy",
-                    quantity,
-                    stop_loss,
+                protective_orders.append(
+                    self.exchange.place_stop_loss(symbol, exit_side, quantity, stop_loss)
                 )
-
             if take_profit:
-                await self.exchange.place_take_profit(
-                    symbol,
-                    "sell" if action == "BUY" else "buy",
-                    quantity,
-                    take_profit,
+                protective_orders.append(
+                    self.exchange.place_take_profit(symbol, exit_side, quantity, take_profit)
                 )
+            if protective_orders:
+                await asyncio.gather(*protective_orders)
 
         except Exception as exc:
-            log.error("Error executing trade for %s: %s", symbol, exc, exc_info=True)
+            log.exception("Error executing trade for {}: {}", symbol, exc)
 
     async def _log_performance(self, balance: Balance, positions: List[Position]) -> None:
         sharpe = await self.portfolio_tracker.get_sharpe_ratio()
+        initial_balance = get_settings().initial_balance
         total_return = 0.0
-        if settings.initial_balance > 0:
-            total_return = (
-                (balance.total - settings.initial_balance) / settings.initial_balance * 100
-            )
+        if initial_balance > 0:
+            total_return = (balance.total - initial_balance) / initial_balance * 100
 
         log.info(
-            "Portfolio Value: $%.2f | Return: %.2f%% | Positions: %s | Sharpe: %.4f",
+            "Portfolio Value: ${:.2f} | Return: {:.2f}% | Positions: {} | Sharpe: {:.4f}",
             balance.total,
             total_return,
             len(positions),
@@ -233,12 +259,17 @@ async def main() -> None:
     """Application entry point."""
 
     try:
-        settings.validate_config()
+        get_settings().validate_config()
     except ValueError as exc:
-        log.warning("Configuration validation warning: %s", exc)
+        log.warning("Configuration validation warning: {}", exc)
 
     bot = TradingBot()
-    await bot.start()
+    try:
+        await bot.start()
+    finally:
+        # Stop stream subscriptions and close network sessions before
+        # asyncio.run tears the loop down.
+        await bot.exchange.close()
 
 
 if __name__ == "__main__":
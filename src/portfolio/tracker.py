@@ -2,53 +2,118 @@
 
 from __future__ import annotations
 
-import json
+import math
+import os
+import struct
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import Deque, List
 
 import numpy as np
+import orjson
 
+from src.config import DATA_DIR
 from src.exchanges.base import Balance, Position
 
+# Number of equity points kept for statistics
+HISTORY_LIMIT = 500
+_POINT = struct.Struct("<d")
+
 
 class PortfolioTracker:
     """Track portfolio statistics over time."""
 
     def __init__(self, history_file: Path | None = None) -> None:
-        self.history_file = history_file or Path("data/portfolio_history.json")
+        # Equity points are appended to a little-endian float64 file; the
+        # JSON file is only read once to migrate older installs.
+        history_file = history_file or DATA_DIR / "portfolio_history.bin"
+        if history_file.suffix == ".json":
+            # An old-style JSON path: migrate from it into a sibling binary
+            # file rather than appending raw floats to the JSON file.
+            history_file = history_file.with_suffix(".bin")
+        self.history_file = history_file
+        self.legacy_file = history_file.with_suffix(".json")
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
-        self._equity_curve: List[float] = self._load_history()
+
+        self._equity_curve: Deque[float] = deque(maxlen=HISTORY_LIMIT)
+        self._returns: Deque[float] = deque(maxlen=HISTORY_LIMIT - 1)
+        self._sum_r = 0.0
+        self._sum_r2 = 0.0
+        self._evictions = 0
+
+        for value in self._load_history():
+            self._record(value)
+        self._file_points = len(self._equity_curve)
+        self._compact()
 
     def _load_history(self) -> List[float]:
-        if not self.history_file.exists():
-            return []
         try:
-            data = json.loads(self.history_file.read_text())
-            return [float(x) for x in data]
+            if self.history_file.exists():
+                return np.fromfile(self.history_file, dtype="<f8")[-HISTORY_LIMIT:].tolist()
+            if self.legacy_file.exists():
+                data = orjson.loads(self.legacy_file.read_bytes())
+                return [float(x) for x in data][-HISTORY_LIMIT:]
         except Exception:
-            return []
-
-    def _save_history(self) -> None:
-        self.history_file.write_text(json.dumps(self._equity_curve, indent=2))
+            pass
+        return []
+
+    def _compact(self) -> None:
+        """Rewrite the history file with only the retained points."""
+
+        tmp_file = self.history_file.with_suffix(".tmp")
+        tmp_file.write_bytes(np.asarray(self._equity_curve, dtype="<f8").tobytes())
+        os.replace(tmp_file, self.history_file)
+        self._file_points = len(self._equity_curve)
+
+    def _record(self, value: float) -> None:
+        """Append an equity point and update the running return sums."""
+
+        previous = self._equity_curve[-1] if self._equity_curve else 0.0
+        if previous:
+            ret = (value - previous) / previous
+            if len(self._returns) == self._returns.maxlen:
+                dropped = self._returns[0]
+                self._sum_r -= dropped
+                self._sum_r2 -= dropped * dropped
+                self._evictions += 1
+            self._returns.append(ret)
+            self._sum_r += ret
+            self._sum_r2 += ret * ret
+
+            # Re-sum now and then so subtraction error cannot accumulate
+            if self._evictions >= HISTORY_LIMIT:
+                self._sum_r = math.fsum(self._returns)
+                self._sum_r2 = math.fsum(r * r for r in self._returns)
+                self._evictions = 0
+        self._equity_curve.append(value)
 
     async def update(self, balance: Balance, positions: List[Position]) -> None:
         """Record the latest account value."""
 
-        self._equity_curve.append(balance.total)
-        self._equity_curve = self._equity_curve[-500:]
-        self._save_history()
+        value = float(balance.total)
+        self._record(value)
+
+        with open(self.history_file, "ab") as handle:
+            handle.write(_POINT.pack(value))
+        self._file_points += 1
+        if self._file_points >= 2 * HISTORY_LIMIT:
+            self._compact()
 
     async def get_sharpe_ratio(self) -> float:
         """Return a simple Sharpe ratio estimate."""
 
-        if len(self._equity_curve) < 2:
+        n = len(self._returns)
+        if n == 0:
             return 0.0
 
-        returns = np.diff(self._equity_curve) / np.array(self._equity_curve[:-1])
-        if returns.std() == 0:
+        mean = self._sum_r / n
+        mean_sq = self._sum_r2 / n
+        variance = mean_sq - mean * mean
+        # Treat leftovers of floating-point cancellation as a flat curve
+        if mean_sq <= 1e-18 or variance <= 1e-12 * mean_sq:
             return 0.0
-        sharpe_daily = returns.mean() / returns.std() * np.sqrt(365)
-        return float(np.round(sharpe_daily, 4))
+        sharpe_daily = mean / math.sqrt(variance) * math.sqrt(365)
+        return round(sharpe_daily, 4)
 
 
 __all__ = ["PortfolioTracker"]
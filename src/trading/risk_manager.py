@@ -4,13 +4,16 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from src.config import settings
+from src.config import get_settings
 from src.logger import log
 
 
 class RiskManager:
     """Validate trade recommendations before execution."""
 
+    def __init__(self) -> None:
+        self._symbol_set = frozenset(get_settings().symbol_list)
+
     def validate_trade(self, decision: Dict[str, Any]) -> bool:
         """Return ``True`` if the trade passes all risk checks."""
 
@@ -18,9 +21,11 @@ class RiskManager:
         if action == "HOLD":
             return True
 
+        settings = get_settings()
+
         symbol = decision.get("symbol")
-        if symbol not in settings.symbol_list:
-            log.warning("RiskManager rejected trade: unknown symbol %s", symbol)
+        if symbol not in self._symbol_set:
+            log.warning("RiskManager rejected trade: unknown symbol {}", symbol)
             return False
 
         position_size = float(decision.get("position_size_pct", settings.position_size_pct) or 0)
@@ -30,7 +35,7 @@ class RiskManager:
 
         if position_size > settings.max_position_size_pct:
             log.warning(
-                "RiskManager rejected trade: %.2f%% position exceeds limit %.2f%%",
+                "RiskManager rejected trade: {:.2f}% position exceeds limit {:.2f}%",
                 position_size,
                 settings.max_position_size_pct,
             )
@@ -0,0 +1,87 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.ai.base_model import BaseAIModel
+from src.ai.caching_model import CachingAIModel, SqliteCache
+
+
+class _CountingModel(BaseAIModel):
+    model = "counting"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_trading_decision(self, system_prompt: str) -> str:
+        self.calls += 1
+        return f'{{"call": {self.calls}}}'
+
+
+def _prompt(invocation: int, price: float) -> str:
+    return (
+        f"It has been {invocation} invocations since you started trading.\n"
+        f"The current time is 2025-01-01T00:00:0{invocation}.\n\n"
+        f"current_price = {price}"
+    )
+
+
+class CachingAIModelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner = _CountingModel()
+        self.model = CachingAIModel(self.inner, ttl=60)
+
+    def test_repeated_prompt_is_served_from_cache(self):
+        first = asyncio.run(self.model.get_trading_decision(_prompt(1, 100.0)))
+        second = asyncio.run(self.model.get_trading_decision(_prompt(2, 100.0)))
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.inner.calls, 1)
+
+    def test_changed_market_data_misses_cache(self):
+        asyncio.run(self.model.get_trading_decision(_prompt(1, 100.0)))
+        asyncio.run(self.model.get_trading_decision(_prompt(2, 101.0)))
+
+        self.assertEqual(self.inner.calls, 2)
+
+    def test_expired_entry_is_refreshed(self):
+        model = CachingAIModel(self.inner, ttl=0)
+        asyncio.run(model.get_trading_decision(_prompt(1, 100.0)))
+        asyncio.run(model.get_trading_decision(_prompt(2, 100.0)))
+
+        self.assertEqual(self.inner.calls, 2)
+
+
+class SqliteCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "responses.sqlite"
+
+    def test_response_survives_a_new_process(self):
+        first_run = _CountingModel()
+        asyncio.run(
+            CachingAIModel(first_run, ttl=60, cache=SqliteCache(self.path))
+            .get_trading_decision(_prompt(1, 100.0))
+        )
+
+        second_run = _CountingModel()
+        value = asyncio.run(
+            CachingAIModel(second_run, ttl=60, cache=SqliteCache(self.path))
+            .get_trading_decision(_prompt(2, 100.0))
+        )
+
+        self.assertEqual(value, '{"call": 1}')
+        self.assertEqual(second_run.calls, 0)
+
+    def test_oldest_entries_are_evicted(self):
+        cache = SqliteCache(self.path, maxsize=2)
+        for i in range(3):
+            cache.set(f"key{i}", "value", float(i))
+
+        self.assertIsNone(cache.get("key0"))
+        self.assertEqual(cache.get("key2"), ("value", 2.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.indicators.technical import TechnicalIndicatorCalculator
+
+
+def _candles(timestamps):
+    return [
+        {"timestamp": ts, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.0}
+        for ts in timestamps
+    ]
+
+
+def _parsed_by_pandas(timestamps, unit):
+    parsed = pd.to_datetime(pd.Index(timestamps), unit=unit, utc=True)
+    return pd.DatetimeIndex(parsed).tz_localize(None)
+
+
+class CandlesToDataFrameTests(unittest.TestCase):
+    def assert_index_matches(self, timestamps, unit):
+        frame = TechnicalIndicatorCalculator._candles_to_dataframe(_candles(timestamps))
+        expected = _parsed_by_pandas(timestamps, unit)
+
+        self.assertEqual(frame.index.dtype, expected.dtype)
+        pd.testing.assert_index_equal(frame.index, expected)
+
+    def test_integer_milliseconds_match_to_datetime(self):
+        self.assert_index_matches([1_700_000_000_000, 1_700_000_180_000], "ms")
+
+    def test_integer_seconds_match_to_datetime(self):
+        self.assert_index_matches([1_700_000_000, 1_700_000_180], "s")
+
+    def test_whole_float_milliseconds_match_to_datetime(self):
+        self.assert_index_matches([1_700_000_000_000.0, 1_700_000_180_000.0], "ms")
+
+    def test_fractional_seconds_fall_back_to_to_datetime(self):
+        self.assert_index_matches([1_700_000_000.5, 1_700_000_180.25], "s")
+
+    def test_nan_timestamp_is_rejected(self):
+        with self.assertRaises(ValueError):
+            TechnicalIndicatorCalculator._candles_to_dataframe(_candles([1_700_000_000_000.0, np.nan]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,10 @@
+import asyncio
 import importlib.util
+import json
 import sys
+import tempfile
+import threading
+import time
 import types
 import unittest
 from pathlib import Path
@@ -47,10 +52,18 @@ class MarketDataFetcherTests(unittest.TestCase):
 
     def _mock_response(self, payload):
         response = MagicMock()
-        response.json.return_value = payload
+        response.content = json.dumps(payload).encode()
         response.raise_for_status.return_value = None
         return response
 
+    def test_warm_up_pings_in_background(self):
+        fetcher = MarketDataFetcher(session=self.session, warm_up=True)
+        for thread in threading.enumerate():
+            if thread.name == "coingecko-warm-up":
+                thread.join(timeout=1)
+
+        self.session.get.assert_called_once_with(f"{fetcher.coingecko_base}/ping", timeout=10)
+
     def test_get_current_price_uses_cache(self):
         self.session.get.return_value = self._mock_response({"bitcoin": {"usd": 123.45}})
 
@@ -64,6 +77,28 @@ class MarketDataFetcherTests(unittest.TestCase):
         self.assertEqual(cached_price, 123.45)
         self.session.get.assert_not_called()
 
+    def test_aget_prices_uses_one_batch_request(self):
+        self.session.get.return_value = self._mock_response(
+            {"bitcoin": {"usd": 100.0}, "ethereum": {"usd": 10.0}}
+        )
+
+        prices = asyncio.run(self.fetcher.aget_prices(["BTC-PERPETUAL", "ETH-PERPETUAL"]))
+
+        self.assertEqual(prices, {"BTC-PERPETUAL": 100.0, "ETH-PERPETUAL": 10.0})
+        self.session.get.assert_called_once()
+
+    def test_concurrent_aget_price_shares_one_request(self):
+        self.session.get.return_value = self._mock_response({"bitcoin": {"usd": 100.0}})
+
+        async def fetch_twice():
+            return await asyncio.gather(
+                self.fetcher.aget_price("BTC-PERPETUAL"),
+                self.fetcher.aget_price("BTC-PERPETUAL"),
+            )
+
+        self.assertEqual(asyncio.run(fetch_twice()), [100.0, 100.0])
+        self.session.get.assert_called_once()
+
     def test_get_ohlcv_aggregates_prices(self):
         chart_data = {
             "prices": [
@@ -102,6 +137,81 @@ class MarketDataFetcherTests(unittest.TestCase):
         # Cached result should equal the freshly computed one
         self.assertEqual(candles_first, candles_second)
 
+    def test_smaller_limit_is_sliced_from_cache(self):
+        chart_data = {"prices": [[0, 100.0], [60_000, 110.0], [120_000, 105.0]], "total_volumes": []}
+
+        with patch.object(self.fetcher, "_fetch_market_chart", return_value=chart_data) as mock_chart:
+            self.fetcher.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=3)
+            candles = self.fetcher.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=1)
+
+        mock_chart.assert_called_once()
+        self.assertEqual([c["close"] for c in candles], [105.0])
+
+    def test_coarser_cached_window_is_not_sliced(self):
+        chart_data = {"prices": [[0, 100.0], [60_000, 110.0], [120_000, 105.0]], "total_volumes": []}
+
+        with patch.object(self.fetcher, "_fetch_market_chart", return_value=chart_data) as mock_chart:
+            # Three days of 1m candles come back hourly; one day is 5-minutely
+            self.fetcher.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=3 * 24 * 60)
+            self.fetcher.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=3)
+
+        self.assertEqual([call.args[1] for call in mock_chart.call_args_list], [3, 1])
+
+    def test_disk_cache_survives_new_fetcher(self):
+        chart_data = {"prices": [[0, 100.0], [60_000, 110.0]], "total_volumes": []}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "ohlcv.sqlite"
+            first = MarketDataFetcher(session=self.session, ohlcv_ttl=300, cache_path=cache_path)
+            with patch.object(first, "_fetch_market_chart", return_value=chart_data):
+                first.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=2)
+
+            second = MarketDataFetcher(session=self.session, ohlcv_ttl=300, cache_path=cache_path)
+            with patch.object(second, "_fetch_market_chart") as mock_chart:
+                candles = second.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=2)
+
+            first._disk.close()
+            second._disk.close()
+
+        mock_chart.assert_not_called()
+        self.assertEqual([c["close"] for c in candles], [100.0, 110.0])
+
+    def test_disk_cache_outlives_memory_ttl(self):
+        chart_data = {"prices": [[0, 100.0], [60_000, 110.0]], "total_volumes": []}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "ohlcv.sqlite"
+            first = MarketDataFetcher(session=self.session, ohlcv_ttl=60, cache_path=cache_path, disk_ttl=600)
+            with patch.object(first, "_fetch_market_chart", return_value=chart_data):
+                first.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=2)
+
+            # A restart three minutes later is past the in-memory TTL
+            restarted_at = time.time() + 180
+            second = MarketDataFetcher(session=self.session, ohlcv_ttl=60, cache_path=cache_path, disk_ttl=600)
+            with patch.object(second, "_fetch_market_chart") as mock_chart, \
+                    patch.object(market_data_fetcher.time, "time", return_value=restarted_at):
+                candles = second.get_ohlcv("BTC-PERPETUAL", timeframe_minutes=1, limit=2)
+
+            first._disk.close()
+            second._disk.close()
+
+        mock_chart.assert_not_called()
+        self.assertEqual([c["close"] for c in candles], [100.0, 110.0])
+
+    def test_aget_many_ohlcv_returns_candles_per_symbol(self):
+        chart_data = {"prices": [[0, 100.0], [60_000, 110.0]], "total_volumes": []}
+
+        with patch.object(self.fetcher, "_fetch_market_chart", return_value=chart_data) as mock_chart:
+            result = asyncio.run(
+                self.fetcher.aget_many_ohlcv(
+                    ["BTC-PERPETUAL", "ETH-PERPETUAL"], timeframe_minutes=2, limit=1
+                )
+            )
+
+        self.assertEqual(list(result), ["BTC-PERPETUAL", "ETH-PERPETUAL"])
+        self.assertEqual(result["ETH-PERPETUAL"][0]["close"], 110.0)
+        self.assertEqual(mock_chart.call_count, 2)
+
     def test_estimate_open_interest(self):
         with patch.object(
             self.fetcher,
@@ -0,0 +1,89 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Loaded by path so the package ``__init__`` (settings, logging) is not
+# imported; registered under its real name so numba's on-disk cache and
+# eager compilation resolve the module.
+KERNELS_PATH = Path(__file__).resolve().parents[1] / "src" / "indicators" / "_kernels.py"
+spec = importlib.util.spec_from_file_location("src.indicators._kernels", KERNELS_PATH)
+kernels = sys.modules.setdefault(spec.name, importlib.util.module_from_spec(spec))
+if kernels.__spec__ is spec:
+    spec.loader.exec_module(kernels)
+
+
+def _sma_seeded_ema(series: pd.Series, length: int) -> pd.Series:
+    series = series.copy()
+    seed = series.iloc[:length].mean()
+    series.iloc[: length - 1] = np.nan
+    series.iloc[length - 1] = seed
+    return series.ewm(span=length, adjust=False).mean()
+
+
+def _rma(series: pd.Series, length: int) -> pd.Series:
+    return series.ewm(alpha=1 / length, min_periods=length).mean()
+
+
+class ComputeAllTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(7)
+        self.close = pd.Series(100 + np.cumsum(rng.normal(size=200)))
+        self.high = self.close + rng.random(200)
+        self.low = self.close - rng.random(200)
+
+    def test_matches_pandas_reference(self):
+        close, high, low = self.close, self.high, self.low
+        ema_fast = _sma_seeded_ema(close, 12)
+        ema_slow = _sma_seeded_ema(close, 26)
+        macd = ema_fast - ema_slow
+        signal = _sma_seeded_ema(macd.dropna(), 9).reindex(close.index)
+        delta = close.diff()
+        gain = _rma(delta.clip(lower=0), 14)
+        loss = _rma(-delta.clip(upper=0), 14)
+        previous = close.shift()
+        true_range = pd.concat([high - low, high - previous, previous - low], axis=1).abs().max(axis=1)
+        true_range.iloc[0] = np.nan
+
+        expected = [
+            ema_fast,
+            ema_slow,
+            macd,
+            signal,
+            macd - signal,
+            100 * gain / (gain + loss),
+            _rma(true_range, 14),
+        ]
+        result = kernels.compute_all(
+            high.to_numpy(), low.to_numpy(), close.to_numpy(), 12, 26, 9, 14, 14
+        )
+
+        for want, got in zip(expected, result):
+            np.testing.assert_allclose(got, want.to_numpy(), rtol=1e-10, equal_nan=True)
+
+    def test_writable_and_read_only_inputs_agree(self):
+        read_only = [series.to_numpy() for series in (self.high, self.low, self.close)]
+        for array in read_only:
+            array.flags.writeable = False
+        writable = [array.copy() for array in read_only]
+
+        for got, want in zip(
+            kernels.compute_all(*read_only, 12, 26, 9, 14, 14),
+            kernels.compute_all(*writable, 12, 26, 9, 14, 14),
+        ):
+            np.testing.assert_array_equal(got, want)
+
+    def test_short_input_is_all_nan(self):
+        result = kernels.compute_all(
+            self.high.to_numpy()[:5], self.low.to_numpy()[:5], self.close.to_numpy()[:5], 12, 26, 9, 14, 14
+        )
+
+        for values in result:
+            self.assertTrue(np.isnan(values).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.exchanges.base import Balance
+from src.portfolio.tracker import HISTORY_LIMIT, PortfolioTracker
+
+
+def _full_sharpe(equity):
+    """Recompute the ratio from scratch over the retained equity window."""
+
+    curve = np.asarray(equity[-HISTORY_LIMIT:], dtype=np.float64)
+    returns = np.diff(curve) / curve[:-1]
+    if returns.std() == 0:
+        return 0.0
+    return float(np.round(returns.mean() / returns.std() * np.sqrt(365), 4))
+
+
+class PortfolioTrackerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def _record(self, tracker, values):
+        for value in values:
+            asyncio.run(tracker.update(Balance(total=value, available=value, in_positions=0.0), []))
+
+    def test_incremental_sharpe_matches_full_recompute(self):
+        rng = np.random.default_rng(11)
+        equity = (10_000 * np.cumprod(1 + rng.normal(0.0005, 0.01, 3 * HISTORY_LIMIT))).tolist()
+        tracker = PortfolioTracker(self.dir / "history.bin")
+
+        # Cover the warm-up window, the first evictions and the periodic re-sums
+        recorded = 0
+        for end in (10, HISTORY_LIMIT, HISTORY_LIMIT + 7, 2 * HISTORY_LIMIT + 3, len(equity)):
+            self._record(tracker, equity[recorded:end])
+            recorded = end
+            self.assertAlmostEqual(
+                asyncio.run(tracker.get_sharpe_ratio()), _full_sharpe(equity[:end]), delta=1e-4
+            )
+
+    def test_json_history_path_migrates_to_binary_sibling(self):
+        legacy = self.dir / "history.json"
+        legacy.write_text(json.dumps([100.0, 101.0, 102.0]))
+
+        tracker = PortfolioTracker(legacy)
+        self._record(tracker, [103.0])
+
+        self.assertEqual(tracker.history_file, self.dir / "history.bin")
+        self.assertEqual(json.loads(legacy.read_text()), [100.0, 101.0, 102.0])
+        reloaded = PortfolioTracker(legacy)
+        self.assertEqual(list(reloaded._equity_curve), [100.0, 101.0, 102.0, 103.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
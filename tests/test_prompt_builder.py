@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from src.ai.prompt_builder import PromptBuilder
+from src.exchanges.base import Position
+
+
+class FormatSeriesTests(unittest.TestCase):
+    def test_list_is_compact_json(self):
+        self.assertEqual(PromptBuilder._format_series([1.5, 2.0, 3]), "[1.5,2.0,3]")
+
+    def test_non_finite_values_become_null(self):
+        series = [1.0, float("nan"), float("inf")]
+
+        self.assertEqual(PromptBuilder._format_series(series), "[1.0,null,null]")
+        self.assertEqual(PromptBuilder._format_series(np.array(series)), "[1.0,null,null]")
+
+    def test_missing_series_is_empty_list(self):
+        self.assertEqual(PromptBuilder._format_series(None), "[]")
+
+
+class PortfolioSectionTests(unittest.TestCase):
+    def test_positions_are_indented_json(self):
+        position = Position("BTC-PERPETUAL", "long", 0.5, 100.0, 110.0, 5.0, None, 20)
+
+        section = PromptBuilder()._build_portfolio_section({}, [position])
+
+        self.assertIn(
+            "Current live positions & performance: [\n"
+            "  {\n"
+            '    "symbol": "BTC-PERPETUAL",\n'
+            '    "side": "long",\n'
+            '    "quantity": 0.5,\n'
+            '    "entry_price": 100.0,\n'
+            '    "current_price": 110.0,\n'
+            '    "liquidation_price": null,\n'
+            '    "unrealized_pnl": 5.0,\n'
+            '    "leverage": 20\n'
+            "  }\n"
+            "]\n",
+            section,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from src.ai.response_parser import parse_ai_decisions, parse_ai_response
+
+
+class ParseAIResponseTests(unittest.TestCase):
+    def test_invalid_action_defaults_to_hold(self):
+        decision = parse_ai_response('{"symbol": "ETH-PERPETUAL", "action": "moon"}')
+
+        self.assertEqual(decision["symbol"], "ETH-PERPETUAL")
+        self.assertEqual(decision["action"], "HOLD")
+
+    def test_keys_and_action_are_normalised(self):
+        decision = parse_ai_response({"Symbol": "SOL-PERPETUAL", "ACTION": "buy", "Confidence": "0.5"})
+
+        self.assertEqual(decision["symbol"], "SOL-PERPETUAL")
+        self.assertEqual(decision["action"], "BUY")
+        self.assertEqual(decision["confidence"], 0.5)
+
+
+class ParseAIDecisionsTests(unittest.TestCase):
+    def test_array_yields_one_decision_per_coin(self):
+        payload = json.dumps(
+            [
+                {"symbol": "BTC-PERPETUAL", "action": "BUY", "confidence": 0.9},
+                {"symbol": "ETH-PERPETUAL", "action": "HOLD"},
+            ]
+        )
+
+        decisions = parse_ai_decisions(payload)
+
+        self.assertEqual([d["symbol"] for d in decisions], ["BTC-PERPETUAL", "ETH-PERPETUAL"])
+        self.assertEqual([d["action"] for d in decisions], ["BUY", "HOLD"])
+
+    def test_single_object_is_accepted(self):
+        decisions = parse_ai_decisions('{"symbol": "XRP-PERPETUAL", "action": "SELL"}')
+
+        self.assertEqual(len(decisions), 1)
+        self.assertEqual(decisions[0]["action"], "SELL")
+
+    def test_truncated_array_keeps_complete_decisions(self):
+        payload = (
+            '[{"symbol": "BTC-PERPETUAL", "action": "BUY"}, '
+            '{"symbol": "ETH-PERPETUAL", "action": "SELL"}, '
+            '{"symbol": "SOL-PERPETUAL", "reas'
+        )
+
+        decisions = parse_ai_decisions(payload)
+
+        self.assertEqual([d["symbol"] for d in decisions], ["BTC-PERPETUAL", "ETH-PERPETUAL"])
+
+    def test_garbage_defaults_to_single_hold(self):
+        decisions = parse_ai_decisions("not json")
+
+        self.assertEqual(len(decisions), 1)
+        self.assertEqual(decisions[0]["action"], "HOLD")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from web import app as dashboard
+
+
+def _data(total: float) -> dict:
+    now = datetime.now()
+    return {
+        "balance": {"total": total},
+        "balance_history": [{"timestamp": now, "total": total}],
+        "positions": [],
+        "last_updated": now,
+        "raw_balance": {"total": total},
+    }
+
+
+class DashboardETagTests(unittest.TestCase):
+    def setUp(self) -> None:
+        dashboard._CACHE.update(key=None, bytes=None, etag=None, expires=0.0)
+        self.client = dashboard.app.test_client()
+
+    def _get(self, total: float, etag: str | None = None):
+        headers = {"If-None-Match": etag} if etag else {}
+        with mock.patch.object(dashboard, "get_dashboard_data", return_value=_data(total)), \
+                mock.patch.object(dashboard, "DASHBOARD_TTL", 0.0):
+            return self.client.get("/api/dashboard", headers=headers)
+
+    def test_unchanged_payload_returns_not_modified(self):
+        first = self._get(100.0)
+        etag = first.headers["ETag"]
+
+        second = self._get(100.0, etag)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b"")
+
+    def test_changed_payload_returns_new_body(self):
+        etag = self._get(100.0).headers["ETag"]
+
+        response = self._get(101.0, etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.get_json()["balance"]["total"], 101.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
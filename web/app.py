@@ -3,19 +3,58 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import asdict
+import hashlib
+import heapq
+import os
+import threading
+import time
+from dataclasses import fields
 from datetime import datetime, timedelta
+from functools import cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Tuple, TypeVar
 
-from flask import Flask, jsonify, render_template
+import orjson
+from flask import Flask, Response, render_template, request
 
-from src.config import settings
-from src.exchanges.mock_exchange import MockExchange
+# The exchange stack (numpy, the market data fetcher) and the settings are
+# imported on first use, keeping reloads and health-check processes light.
+if TYPE_CHECKING:
+    from src.exchanges.base import Balance, Position
+    from src.exchanges.mock_exchange import MockExchange
+
+T = TypeVar("T")
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
 
+
+@cache
+def _state_files() -> Tuple[Path, Path]:
+    from src.exchanges.mock_exchange import STATE_FILE, WAL_FILE
+
+    return STATE_FILE, WAL_FILE
+
+
+@cache
+def _initial_balance() -> Tuple[float, float]:
+    """Return the initial balance and its ``100 / initial`` percent factor."""
+    from src.config import get_settings
+
+    # Settings do not change while the dashboard runs; read them once.
+    initial = get_settings().initial_balance
+    return initial, (100.0 / initial if initial else 0.0)
+
+
+@cache
+def _balance_fields() -> Tuple[str, ...]:
+    from src.exchanges.base import Balance
+
+    # Field names for a flat copy; ``asdict`` deep-copies every value.
+    return tuple(f.name for f in fields(Balance))
+
+
 # Create a single exchange instance so that we reuse cached market data and
 # avoid hitting the filesystem on every request.
 _exchange: MockExchange | None = None
@@ -25,6 +64,10 @@ def get_exchange() -> MockExchange:
     """Return a cached instance of the mock exchange."""
     global _exchange
     if _exchange is None:
+        from src.config import get_settings
+        from src.exchanges.mock_exchange import MockExchange
+
+        settings = get_settings()
         _exchange = MockExchange(
             api_key=settings.exchange_api_key,
             secret=settings.exchange_secret,
@@ -33,49 +76,134 @@ def get_exchange() -> MockExchange:
     return _exchange
 
 
-def _load_state() -> Dict[str, Any]:
-    state_file = Path("data/mock_exchange_state.json")
-    if not state_file.exists():
-        return {}
-    try:
-        return json.loads(state_file.read_text())
-    except json.JSONDecodeError:
-        return {}
+# One long-lived loop runs the exchange coroutines for every request, instead
+# of a loop being created and torn down per request. Its thread is started on
+# first use, so importing the module (tests, a forking server) starts nothing.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
 
 
-def _serialize_positions(positions: List[Any]) -> List[Dict[str, Any]]:
-    serialized: List[Dict[str, Any]] = []
-    for position in positions:
-        position_dict = asdict(position)
-        # Format floats for readability on the frontend.
-        position_dict.update(
-            {
-                "quantity": float(position_dict.get("quantity", 0.0)),
-                "entry_price": float(position_dict.get("entry_price", 0.0)),
-                "current_price": float(position_dict.get("current_price", 0.0)),
-                "unrealized_pnl": float(position_dict.get("unrealized_pnl", 0.0)),
-                "liquidation_price": (
-                    float(position_dict.get("liquidation_price"))
-                    if position_dict.get("liquidation_price") is not None
-                    else None
-                ),
-            }
-        )
-        serialized.append(position_dict)
-    return serialized
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="dashboard-loop", daemon=True).start()
+            _loop = loop
+    return _loop
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the shared loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
+
+
+def _state_key() -> tuple:
+    """Identify the on-disk state by the snapshot and WAL file stats."""
+    key = []
+    for path in _state_files():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            key.append(None)
+        else:
+            key.append((st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
+def _add_trade_ns(state: Dict[str, Any]) -> None:
+    """Give trades logged before ``ts_ns`` existed an integer sort key."""
+    for trade in state.get("trade_history", ()):
+        if "ts_ns" not in trade:
+            try:
+                ts = datetime.fromisoformat(trade["timestamp"])
+                trade["ts_ns"] = round(ts.timestamp() * 1e6) * 1000
+            except (KeyError, TypeError, ValueError):
+                trade["ts_ns"] = 0
+
+
+_TRADE_NS = itemgetter("ts_ns")
+
+
+# Display order for order statuses: live orders first, unknown ones last.
+_STATUS_RANK = {"open": 0, "pending": 0, "partially_filled": 1, "filled": 2, "cancelled": 3}
+_UNKNOWN_RANK = max(_STATUS_RANK.values()) + 1
+
+
+def _build_orders(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # A handful of statuses, so bucket the orders instead of sorting them.
+    buckets: List[List[Dict[str, Any]]] = [[] for _ in range(_UNKNOWN_RANK + 1)]
+    for order_id, info in state.get("orders", {}).items():
+        rank = _STATUS_RANK.get(info.get("status"), _UNKNOWN_RANK)
+        buckets[rank].append({"order_id": order_id, **info})
+    return list(chain.from_iterable(buckets))
+
+
+# Parsed state plus the order list derived from it, reused until the
+# snapshot or WAL file changes on disk.
+_STATE_CACHE: Dict[str, Any] = {"key": None, "value": {}, "orders": []}
+_state_lock = threading.Lock()
+
+
+def _load_state() -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    key = _state_key()
+    with _state_lock:
+        if _STATE_CACHE["key"] != key:
+            from src.exchanges.mock_exchange import read_state
+
+            # read_state already parses raw bytes; a missing file is just a
+            # failed open instead of a separate exists() stat.
+            try:
+                value = read_state(*_state_files())
+            except (FileNotFoundError, ValueError):
+                value = {}
+            _add_trade_ns(value)
+            _STATE_CACHE["key"] = key
+            _STATE_CACHE["value"] = value
+            _STATE_CACHE["orders"] = _build_orders(value)
+        return _STATE_CACHE["value"], _STATE_CACHE["orders"]
+
+
+# Position fields coerced to float for the frontend.
+_FLOAT_FIELDS = frozenset({"quantity", "entry_price", "current_price", "unrealized_pnl"})
+_OPTIONAL_FLOAT_FIELDS = frozenset({"liquidation_price"})
+
+
+@cache
+def _position_serializer() -> Callable[[Position], Dict[str, Any]]:
+    """Generate a serializer with every field access and coercion inlined."""
+    from src.exchanges.base import Position
+
+    items = []
+    for field in fields(Position):
+        name = field.name
+        if name in _FLOAT_FIELDS:
+            expr = f"float(p.{name})"
+        elif name in _OPTIONAL_FLOAT_FIELDS:
+            expr = f"None if p.{name} is None else float(p.{name})"
+        else:
+            expr = f"p.{name}"
+        items.append(f"{name!r}: {expr}")
+    source = f"def serialize_position(p):\n    return {{{', '.join(items)}}}\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, {"float": float}, namespace)
+    return namespace["serialize_position"]
+
+
+def _serialize_positions(positions: List[Position]) -> List[Dict[str, Any]]:
+    serialize = _position_serializer()
+    return [serialize(position) for position in positions]
 
 
 def _build_balance_summary(state: Dict[str, Any]) -> Dict[str, Any]:
+    initial_balance, pct_factor = _initial_balance()
     balance = state.get("balance", {})
-    total = float(balance.get("total", settings.initial_balance))
+    total = float(balance.get("total", initial_balance))
     available = float(balance.get("available", 0.0))
     in_positions = float(balance.get("in_positions", 0.0))
-    profit_loss = total - settings.initial_balance
-    profit_loss_pct = (
-        (profit_loss / settings.initial_balance) * 100
-        if settings.initial_balance
-        else 0.0
-    )
+    profit_loss = total - initial_balance
+    profit_loss_pct = profit_loss * pct_factor
 
     return {
         "total": total,
@@ -86,96 +214,113 @@ def _build_balance_summary(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _build_balance_history(state: Dict[str, Any], total_balance: float) -> List[Dict[str, Any]]:
+def _build_balance_history(
+    state: Dict[str, Any], total_balance: float, now: datetime
+) -> List[Dict[str, Any]]:
     history = state.get("balance_history") or []
     if not history:
         # If we don't have a history recorded yet, synthesise a basic timeline
         # using the initial balance and the most recent total balance so the
         # chart has something meaningful to display.
         start_time = None
-        if state.get("trade_history"):
-            try:
-                start_time = datetime.fromisoformat(state["trade_history"][0]["timestamp"])
-            except (KeyError, ValueError, IndexError):
-                start_time = None
+        # read_state records the first fill before trimming the history, so
+        # the chart keeps starting where trading began.
+        first_ns = state.get("first_trade_ns")
+        if first_ns is None and state.get("trade_history"):
+            first_ns = state["trade_history"][0]["ts_ns"]
+        if first_ns:
+            start_time = datetime.fromtimestamp(first_ns / 1e9)
         if start_time is None:
-            start_time = datetime.now() - timedelta(hours=1)
+            start_time = now - timedelta(hours=1)
         history = [
             {
-                "timestamp": (start_time - timedelta(minutes=1)).isoformat(),
-                "total": settings.initial_balance,
+                "timestamp": start_time - timedelta(minutes=1),
+                "total": _initial_balance()[0],
             },
             {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now,
                 "total": total_balance,
             },
         ]
     else:
-        # Ensure floats for frontend
-        for item in history:
-            item["total"] = float(item.get("total", total_balance))
+        # Ensure floats for frontend; build new dicts since ``state`` is the
+        # cached parse shared by every request.
+        history = [{**item, "total": float(item.get("total", total_balance))} for item in history]
     return history
 
 
+async def _fetch_account(exchange: MockExchange) -> tuple[Balance, List[Position]]:
+    # Both calls are independent, so let them overlap on the shared loop.
+    return await asyncio.gather(exchange.get_balance(), exchange.get_positions())
+
+
 def get_dashboard_data() -> Dict[str, Any]:
-    state = _load_state()
-    exchange = get_exchange()
-
-    try:
-        balance = asyncio.run(exchange.get_balance())
-    except RuntimeError:
-        # "asyncio.run" cannot be called from a running event loop; fall back
-        # to creating a new loop manually. This primarily happens when the
-        # server is run in debug mode with reloader threads.
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        balance = loop.run_until_complete(exchange.get_balance())
-        loop.close()
-    balance_dict = asdict(balance)
-
-    try:
-        positions = asyncio.run(exchange.get_positions())
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        positions = loop.run_until_complete(exchange.get_positions())
-        loop.close()
+    state, orders = _load_state()
+    # Only the exchange I/O goes to the shared loop; parsing and formatting
+    # stay on the request thread so one slow request cannot stall the loop.
+    balance, positions = _run(_fetch_account(get_exchange()))
+    balance_dict = {name: getattr(balance, name) for name in _balance_fields()}
 
+    # One clock read per payload: chart end point and last_updated agree.
+    now = datetime.now()
     serialized_positions = _serialize_positions(positions)
     balance_summary = _build_balance_summary(state)
-    balance_history = _build_balance_history(state, balance_summary["total"])
-
-    orders = []
-    for order_id, info in state.get("orders", {}).items():
-        order = {"order_id": order_id, **info}
-        orders.append(order)
-    orders.sort(key=lambda item: item.get("status", ""))
+    balance_history = _build_balance_history(state, balance_summary["total"], now)
 
-    trade_history = list(state.get("trade_history", []))
-    trade_history.sort(key=lambda item: item.get("timestamp", ""), reverse=True)
+    # Only the newest trades are shown, so avoid sorting the whole history.
+    trade_history = heapq.nlargest(100, state.get("trade_history", ()), key=_TRADE_NS)
 
     return {
         "balance": balance_summary,
         "balance_history": balance_history,
         "positions": serialized_positions,
         "open_orders": orders,
-        "trade_history": trade_history[:100],
-        "last_updated": datetime.now().isoformat(),
+        "trade_history": trade_history,
+        "last_updated": now,
         "raw_balance": balance_dict,
     }
 
 
+# Burst polls (several tabs, short refresh intervals) share one encoded
+# payload until it expires or the exchange writes new state.
+DASHBOARD_TTL = 0.5
+_CACHE: Dict[str, Any] = {"key": None, "bytes": None, "etag": None, "expires": 0.0}
+_cache_lock = threading.Lock()
+
+
+def _json_response(payload: bytes, etag: str) -> Response:
+    response = Response(payload, mimetype="application/json")
+    response.set_etag(etag)
+    # Answers a matching If-None-Match with an empty 304
+    return response.make_conditional(request)
+
+
 @app.route("/")
 def index():
     data = get_dashboard_data()
-    return render_template("index.html", initial_data=json.dumps(data))
+    return render_template("index.html", initial_data=orjson.dumps(data).decode())
 
 
 @app.route("/api/dashboard")
 def api_dashboard():
-    data = get_dashboard_data()
-    return jsonify(data)
+    key = _state_key()
+    with _cache_lock:
+        if _CACHE["key"] != key or time.monotonic() >= _CACHE["expires"]:
+            data = get_dashboard_data()
+            # Apart from the clock, the payload is derived from the state files
+            # and the live account data, so hash those: polls made while
+            # nothing changed are answered with a 304.
+            digest = hashlib.blake2b(repr(key).encode(), digest_size=8)
+            digest.update(orjson.dumps((data["raw_balance"], data["positions"])))
+            _CACHE["etag"] = digest.hexdigest()
+            _CACHE["bytes"] = orjson.dumps(data)
+            _CACHE["key"] = key
+            _CACHE["expires"] = time.monotonic() + DASHBOARD_TTL
+        payload, etag = _CACHE["bytes"], _CACHE["etag"]
+    return _json_response(payload, etag)
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Development server only (FLASK_DEBUG=1 enables debug mode); production
+    # serves web.app:app with gunicorn.
+    app.run(host="0.0.0.0", port=5000)